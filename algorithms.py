@@ -1,126 +1,335 @@
-import random
-import numpy as np
-import matplotlib.pyplot as plt
-from utils import draw_gantt_chart, print_table
-
-def round_robin(processes, arrival_time, burst_time, quantum):
-    n = len(processes)
-    remaining_time = burst_time[:]
-    completion_time = [0] * n
+import heapq
+from collections import deque
+from models import ExecutionLog
+from policies import PLUGINS, policy_slices
+
+# Each scheduler is a generator of (index, start, end, finished) slices, so a
+# schedule can be consumed lazily without holding its whole execution log.
+#
+# The built-in generators also take order (arrival_order of the workload), checkpoints
+# (a list to which (t, k, ready state) snapshots are appended at most every
+# CHECKPOINT_EVERY slices, where order[:k] have been admitted) and resume (one of those
+# snapshots to continue from); incremental.py uses them to re-simulate only the part
+# of a schedule that a workload edit affects.
+
+CHECKPOINT_EVERY = 1024
+
+def round_robin(processes, arrival_time, burst_time, quantum, stats=None):
+    return _collect(processes, round_robin_slices(arrival_time, burst_time, quantum, stats))
+
+def round_robin_slices(arrival_time, burst_time, quantum, stats=None, order=None, checkpoints=None, resume=None):
+    # Passing order also lets sweeps over quantum sort only once
+    n = len(arrival_time)
+    if order is None:
+        order = arrival_order(arrival_time)
     t = 0
-    done = [False] * n
-    ready_queue = []
-    visited = [False] * n
-    complete = 0
-    execution_log = []
+    k = 0
+    ready_queue = deque()  # (index, remaining time)
+    if resume is not None:
+        t, k, state = resume
+        ready_queue.extend(state)
+    since = 0
 
-    while complete < n:
-        for i in range(n):
-            if arrival_time[i] <= t and not visited[i]:
-                ready_queue.append(i)
-                visited[i] = True
+    def admit_arrivals():
+        # Processes arriving together are enqueued in index order
+        nonlocal k
+        start = k
+        while k < n and arrival_time[order[k]] <= t:
+            k += 1
+        if k - start > 1:
+            ready_queue.extend((i, burst_time[i]) for i in sorted(order[start:k]))
+        elif k > start:
+            ready_queue.append((order[start], burst_time[order[start]]))
 
+    if stats is not None:
+        stats.begin()
+    while k < n or ready_queue:
         if not ready_queue:
-            t += 1
-            continue
+            if stats is not None and arrival_time[order[k]] > t:
+                stats.idle(arrival_time[order[k]] - t)
+            t = max(t, arrival_time[order[k]])  # Skip idle gap
+            admit_arrivals()
 
-        idx = ready_queue.pop(0)
+        if checkpoints is not None:
+            # Copying the queue at most once per its length in slices keeps this O(1) amortized
+            since += 1
+            if since >= CHECKPOINT_EVERY + len(ready_queue):
+                checkpoints.append((t, k, tuple(ready_queue)))
+                since = 0
+
+        if stats is None:
+            idx, remaining = ready_queue.popleft()
+        else:
+            idx, remaining = stats.select(ready_queue.popleft)
+            stats.dispatch(t, idx, len(ready_queue))
         exec_start = t
 
-        if remaining_time[idx] > quantum:
+        if remaining > quantum:
             t += quantum
-            remaining_time[idx] -= quantum
+            remaining -= quantum
         else:
-            t += remaining_time[idx]
-            completion_time[idx] = t
-            remaining_time[idx] = 0
-            done[idx] = True
-            complete += 1
-        
-        exec_end = t
-        execution_log.append((processes[idx], exec_start, exec_end))
-
-        for i in range(n):
-            if arrival_time[i] <= t and not visited[i]:
-                ready_queue.append(i)
-                visited[i] = True
-
-        if remaining_time[idx] > 0:
-            ready_queue.append(idx)
+            t += remaining
+            remaining = 0
 
-    return completion_time, execution_log
+        if stats is not None:
+            stats.end()  # the consumer's time is not the scheduler's
+        yield idx, exec_start, t, remaining == 0
+        if stats is not None:
+            stats.begin()
 
-def fcfs(processes, arrival_time, burst_time):
-    n = len(processes)
-    completion_time = [0] * n
+        admit_arrivals()
+
+        if remaining > 0:
+            ready_queue.append((idx, remaining))
+    if stats is not None:
+        stats.end()
+
+def arrival_order(arrival_time):
+    # Indices by arrival time, ties in index order
+    return sorted(range(len(arrival_time)), key=lambda i: arrival_time[i])
+
+def fcfs(processes, arrival_time, burst_time, stats=None):
+    return _collect(processes, fcfs_slices(arrival_time, burst_time, stats))
+
+def fcfs_slices(arrival_time, burst_time, stats=None, order=None, checkpoints=None, resume=None):
     t = 0
-    order = sorted(range(n), key=lambda i: arrival_time[i])
+    k = 0
+    if order is None:
+        order = arrival_order(arrival_time)
+    if resume is not None:
+        t, k, _ = resume
 
-    execution_log = []
-    for i in order:
+    arrived = k
+    since = 0
+    if stats is not None:
+        stats.begin()
+    for k in range(k, len(order)):
+        i = order[k]
+        if checkpoints is not None:
+            since += 1
+            if since >= CHECKPOINT_EVERY:
+                checkpoints.append((t, k, ()))
+                since = 0
+        if stats is not None:
+            if arrival_time[i] > t:
+                stats.idle(arrival_time[i] - t)
+            # Everything that has arrived by the time i starts is waiting behind it
+            while arrived < len(order) and arrival_time[order[arrived]] <= max(t, arrival_time[i]):
+                arrived += 1
+            stats.dispatch(max(t, arrival_time[i]), i, arrived - k - 1)
         start_time = max(t, arrival_time[i])  # Ensure process starts at arrival time
         t = start_time + burst_time[i]
-        completion_time[i] = t
-        execution_log.append((processes[i], start_time, t))  # Log process execution
-    
-    return completion_time, execution_log
+        if stats is not None:
+            stats.end()
+        yield i, start_time, t, True
+        if stats is not None:
+            stats.begin()
+    if stats is not None:
+        stats.end()
 
-def priority_non_preemptive(processes, arrival_time, burst_time, priorities):
-    n = len(processes)
-    completion_time = [0] * n
-    visited = [False] * n
+def priority_non_preemptive(processes, arrival_time, burst_time, priorities, stats=None):
+    return _collect(processes, priority_non_preemptive_slices(arrival_time, burst_time, priorities, stats))
+
+def priority_non_preemptive_slices(arrival_time, burst_time, priorities, stats=None, order=None, checkpoints=None,
+                                   resume=None):
+    n = len(arrival_time)
+    if order is None:
+        order = arrival_order(arrival_time)
     t = 0
-    complete = 0
+    k = 0
+    heap = []  # (-priority, index), so ties go to the lowest index
+    if resume is not None:
+        t, k, state = resume
+        heap.extend(state)
+    since = 0
 
-    execution_log = []
-    while complete < n:
-        available = [i for i in range(n) if arrival_time[i] <= t and not visited[i]]
-        if not available:
-            t += 1
-            continue
-        
-        idx = max(available, key=lambda i: priorities[i])
-        start_time = max(t, arrival_time[idx])  # Ensure process starts at arrival time
+    if stats is not None:
+        stats.begin()
+    while k < n or heap:
+        if not heap:
+            if stats is not None and arrival_time[order[k]] > t:
+                stats.idle(arrival_time[order[k]] - t)
+            t = max(t, arrival_time[order[k]])  # Skip idle gap
+        while k < n and arrival_time[order[k]] <= t:
+            i = order[k]
+            heapq.heappush(heap, (-priorities[i], i))
+            k += 1
+
+        if checkpoints is not None:
+            since += 1
+            if since >= CHECKPOINT_EVERY + len(heap):
+                checkpoints.append((t, k, tuple(heap)))
+                since = 0
+
+        if stats is None:
+            _, idx = heapq.heappop(heap)
+        else:
+            _, idx = stats.select(heapq.heappop, heap)
+            stats.dispatch(t, idx, len(heap))
+        start_time = t
         t = start_time + burst_time[idx]
-        completion_time[idx] = t
-        visited[idx] = True
-        execution_log.append((processes[idx], start_time, t))  # Log process execution
-        complete += 1
+        if stats is not None:
+            stats.end()
+        yield idx, start_time, t, True
+        if stats is not None:
+            stats.begin()
+    if stats is not None:
+        stats.end()
 
-    return completion_time, execution_log
+def priority_preemptive(processes, arrival_time, burst_time, priorities, stats=None):
+    return _collect(processes, priority_preemptive_slices(arrival_time, burst_time, priorities, stats))
 
-def sjf_preemptive(processes, arrival_time, burst_time):
-    n = len(processes)
-    remaining_time = burst_time.copy()
-    completion_time = [0] * n
+def priority_preemptive_slices(arrival_time, burst_time, priorities, stats=None, **checkpointing):
+    return _preemptive_slices(arrival_time, burst_time,
+                              lambda i, remaining: (-priorities[i], arrival_time[i], i), stats, **checkpointing)
+
+def sjf_preemptive(processes, arrival_time, burst_time, stats=None):
+    return _collect(processes, sjf_preemptive_slices(arrival_time, burst_time, stats))
+
+def sjf_preemptive_slices(arrival_time, burst_time, stats=None, **checkpointing):
+    return _preemptive_slices(arrival_time, burst_time,
+                              lambda i, remaining: (remaining, arrival_time[i], i), stats, **checkpointing)
+
+def _preemptive_slices(arrival_time, burst_time, key, stats=None, order=None, checkpoints=None, resume=None):
+    # The running process only changes on arrivals and completions; key(i, remaining)
+    # must end with the index so heap entries never tie.
+    n = len(arrival_time)
+    if order is None:
+        order = arrival_order(arrival_time)
     current_time = 0
-    complete = 0
-    last_process = -1
-    start_time = 0
+    k = 0
+    heap = []  # (key, remaining, index)
+    if resume is not None:
+        current_time, k, state = resume
+        heap.extend(state)
+    since = 0
+
+    if stats is not None:
+        stats.begin()
+    while k < n or heap:
+        if not heap:
+            if stats is not None and arrival_time[order[k]] > current_time:
+                stats.idle(arrival_time[order[k]] - current_time)
+            current_time = max(current_time, arrival_time[order[k]])  # Skip idle gap
+        while k < n and arrival_time[order[k]] <= current_time:
+            i = order[k]
+            heapq.heappush(heap, (key(i, burst_time[i]), burst_time[i], i))
+            k += 1
+
+        if checkpoints is not None:
+            since += 1
+            if since >= CHECKPOINT_EVERY + len(heap):
+                checkpoints.append((current_time, k, tuple(heap)))
+                since = 0
+
+        if stats is None:
+            _, remaining, idx = heapq.heappop(heap)
+        else:
+            _, remaining, idx = stats.select(heapq.heappop, heap)
+            stats.dispatch(current_time, idx, len(heap))
+        start_time = current_time
+
+        # Run until the next arrival or until done
+        while k < n and arrival_time[order[k]] < current_time + remaining:
+            next_arrival = arrival_time[order[k]]
+            remaining -= next_arrival - current_time
+            current_time = next_arrival
+            while k < n and arrival_time[order[k]] <= current_time:
+                i = order[k]
+                heapq.heappush(heap, (key(i, burst_time[i]), burst_time[i], i))
+                k += 1
+            if heap[0][0] < key(idx, remaining):
+                break
+        else:
+            current_time += remaining
+            remaining = 0
 
+        if stats is not None:
+            stats.end()
+        yield idx, start_time, current_time, remaining == 0
+        if stats is not None:
+            stats.begin()
+        if remaining:
+            heapq.heappush(heap, (key(idx, remaining), remaining, idx))
+    if stats is not None:
+        stats.end()
+
+def _collect(processes, slices):
+    completion_time = [0] * len(processes)
     execution_log = []
-    while complete < n:
-        available = [i for i in range(n) if arrival_time[i] <= current_time and remaining_time[i] > 0]
-        
-        if not available:
-            current_time += 1
-            continue
-        
-        idx = min(available, key=lambda i: (remaining_time[i], arrival_time[i], i))
-        
-        if idx != last_process:
-            if last_process != -1 and remaining_time[last_process] > 0:
-                execution_log.append((processes[last_process], start_time, current_time))
-            start_time = current_time
-            last_process = idx
-        
-        remaining_time[idx] -= 1
-        current_time += 1
-        
-        if remaining_time[idx] == 0:
-            execution_log.append((processes[idx], start_time, current_time))
-            completion_time[idx] = current_time
-            complete += 1
-            last_process = -1
-
-    return completion_time, execution_log 
\ No newline at end of file
+    for idx, start, end, finished in slices:
+        execution_log.append((processes[idx], start, end))  # Log process execution
+        if finished:
+            completion_time[idx] = end
+    return completion_time, execution_log
+
+# stats, when given, is an instrumentation.SchedulerStats (or anything with the same methods)
+SLICES = {
+    "FCFS": lambda w, quantum=None, stats=None, **checkpointing: fcfs_slices(w.arrival, w.burst, stats, **checkpointing),
+    "Round Robin": lambda w, quantum=None, stats=None, **checkpointing:
+        round_robin_slices(w.arrival, w.burst, quantum, stats, **checkpointing),
+    "Priority Non-Preemptive": lambda w, quantum=None, stats=None, **checkpointing:
+        priority_non_preemptive_slices(w.arrival, w.burst, w.priority, stats, **checkpointing),
+    "Priority Preemptive": lambda w, quantum=None, stats=None, **checkpointing:
+        priority_preemptive_slices(w.arrival, w.burst, w.priority, stats, **checkpointing),
+    "SJF Preemptive": lambda w, quantum=None, stats=None, **checkpointing:
+        sjf_preemptive_slices(w.arrival, w.burst, stats, **checkpointing),
+}
+
+# The algorithms whose generators accept order, checkpoints and resume
+RESUMABLE = set(SLICES)
+
+# Registered plugin policies run on the shared event loop in policies.py
+SLICES.update({name: (lambda w, quantum=None, stats=None, policy=policy:
+                      policy_slices(policy(w, quantum), w.arrival, w.burst, stats))
+               for name, policy in PLUGINS.items()})
+
+# Algorithms that take a quantum from the user
+QUANTUM_ALGORITHMS = {"Round Robin"} | {name for name, policy in PLUGINS.items() if policy.uses_quantum}
+
+ALGORITHMS = {name: (lambda w, quantum=None, stats=None, slices=slices: _collect(w.pid, slices(w, quantum, stats)))
+              for name, slices in SLICES.items()}
+
+# Short names for command lines and requests (batch.py, service.py) -> display names
+ALIASES = {
+    "fcfs": "FCFS",
+    "rr": "Round Robin",
+    "priority": "Priority Non-Preemptive",
+    "priority-preemptive": "Priority Preemptive",
+    "sjf": "SJF Preemptive",
+    "mlfq": "MLFQ",
+    "cfs": "CFS",
+}
+
+def schedule(algorithm, workload, quantum=None, stats=None):
+    # Runs an algorithm by its display name on a models.Workload
+    return ALGORITHMS[algorithm](workload, quantum, stats)
+
+def schedule_compact(algorithm, workload, quantum=None, progress=None, stats=None):
+    # Like schedule, but the execution log is a run-length encoded models.ExecutionLog.
+    # progress, if given, is called with the completed fraction about every 1%.
+    n = len(workload)
+    completion_time = [0] * n
+    execution_log = ExecutionLog()
+    pid = workload.pid
+    step = max(1, n // 100)
+    completed = 0
+    for idx, start, end, finished in SLICES[algorithm](workload, quantum, stats):
+        execution_log.add_entry(pid[idx], start, end)
+        if finished:
+            completion_time[idx] = end
+            if progress is not None:
+                completed += 1
+                if completed % step == 0:
+                    progress(completed / n)
+    return completion_time, execution_log
+
+def iter_slices(algorithm, workload, quantum=None, stats=None):
+    # Lazily yields (index, start, end, finished) for a models.Workload
+    return SLICES[algorithm](workload, quantum, stats)
+
+def stream_schedule(algorithm, workload, quantum=None, stats=None):
+    # Lazily yields (pid, start, end) like the entries of an execution log
+    pid = workload.pid
+    for idx, start, end, _ in SLICES[algorithm](workload, quantum, stats):
+        yield pid[idx], start, end
@@ -0,0 +1,84 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from algorithms import ALIASES as ALGORITHMS, schedule
+from metrics import compute_metrics
+from smp import POLICIES, schedule_smp
+from workload import load_processes
+
+FIELDS = ["file", "algorithm", "cpus", "processes", "avg_turnaround", "avg_waiting", "avg_response", "p50_waiting",
+          "p95_waiting", "p99_waiting", "max_waiting", "makespan", "throughput", "utilization", "fairness"]
+
+def run_file(filename, algorithms, quantum, seed, cpus=1, gantt=None):
+    workload = load_processes(filename, seed)
+    rows = []
+    for name in algorithms:
+        if cpus == 1:
+            completion_time, execution_log = schedule(ALGORITHMS[name], workload, quantum)
+        else:
+            completion_time, execution_log, _ = schedule_smp(ALGORITHMS[name], workload, cpus, quantum)
+        metrics = compute_metrics(workload, completion_time, execution_log, cpus)
+        if gantt:
+            # One zoomable SVG per file and algorithm, with the exporter imported only when asked for
+            from gantt_export import export_svg
+
+            stem = os.path.splitext(os.path.basename(filename))[0]
+            export_svg(execution_log, os.path.join(gantt, f"{stem}-{name}.svg"),
+                       title=f"{ALGORITHMS[name]} - {filename}")
+        rows.append(dict({field: metrics.get(field) for field in FIELDS}, file=filename, algorithm=name, cpus=cpus))
+    return rows
+
+def write_results(rows, output, fmt):
+    out = open(output, "w", newline="") if output else sys.stdout
+    try:
+        if fmt == "csv":
+            writer = csv.DictWriter(out, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            json.dump(rows, out, indent=2)
+            out.write("\n")
+    finally:
+        if output:
+            out.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run scheduling algorithms on workload files without the GUI.")
+    parser.add_argument("files", nargs="+", help="parameter files (like Data/input.txt), saved process tables or workload traces")
+    parser.add_argument("-a", "--algorithms", nargs="+", choices=sorted(ALGORITHMS),
+                        help="default: all, or all that run on several CPUs with --cpus")
+    parser.add_argument("-q", "--quantum", type=int, default=2, help="quantum of Round Robin, MLFQ and CFS (default: 2)")
+    parser.add_argument("-c", "--cpus", type=int, default=1, help="simulated CPUs (default: 1)")
+    parser.add_argument("-s", "--seed", type=int, help="seed for workloads generated from parameter files")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("-f", "--format", choices=["json", "csv"], default="json")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("-g", "--gantt", metavar="DIR", help="also write a Gantt chart SVG per file and algorithm here")
+    args = parser.parse_args(argv)
+
+    if args.quantum <= 0:
+        parser.error("quantum must be greater than 0")
+    if args.cpus <= 0:
+        parser.error("cpus must be greater than 0")
+    if args.algorithms is None:
+        args.algorithms = [name for name in sorted(ALGORITHMS) if args.cpus == 1 or ALGORITHMS[name] in POLICIES]
+    elif args.cpus > 1:
+        single = [name for name in args.algorithms if ALGORITHMS[name] not in POLICIES]
+        if single:
+            parser.error(f"{', '.join(single)} can only be simulated on one CPU")
+
+    if args.gantt:
+        os.makedirs(args.gantt, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [executor.submit(run_file, f, args.algorithms, args.quantum, args.seed, args.cpus, args.gantt)
+                   for f in args.files]
+        rows = [row for future in futures for row in future.result()]
+
+    write_results(rows, args.output, args.format)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+import numpy as np
+
+# Many same-sized workloads scheduled at once: arrival, burst and priority are (batch, n)
+# int arrays, one workload per row, and the result is the (batch, n) completion times,
+# the same as running the algorithm on every row. FCFS is a closed form over the rows.
+# The other algorithms take one scheduling decision per step for all workloads together,
+# so the Python overhead is paid per step instead of per slice of every workload.
+#
+# Internally the workloads are columns of (n, batch) arrays, so everything a step does
+# either touches one entry per workload or reduces over a short contiguous axis. The
+# ready processes of every workload sit in a pool of sort keys that end with something
+# unique per process; a min over the pool picks the next process of every workload and
+# the key tells which one it is. Priority Non-Preemptive needs no pool: it only ever takes
+# the first due process in priority order.
+
+IDLE = 1 << 62  # Pool entry of a process that is not ready
+
+def _fcfs(arrival, burst, priority, quantum):
+    # In arrival order, process k finishes at C[k] + max over j <= k of (a[j] - C[j - 1]),
+    # with C the running sum of bursts: the start of the last busy period before it
+    if (arrival[:, 1:] >= arrival[:, :-1]).all():
+        return np.cumsum(burst, axis=1) + np.maximum.accumulate(arrival - np.cumsum(burst, axis=1) + burst, axis=1)
+    order = np.argsort(arrival, axis=1, kind="stable")  # ties in index order
+    a = np.take_along_axis(arrival, order, axis=1)
+    b = np.take_along_axis(burst, order, axis=1)
+    c = np.cumsum(b, axis=1)
+    completion = np.empty_like(c)
+    np.put_along_axis(completion, order, c + np.maximum.accumulate(a - c + b, axis=1), axis=1)
+    return completion
+
+class _Arrivals:
+    # Every workload's arrivals in order (ties in index order) with a pointer to the next one.
+    # Processes are addressed by flat positions index * batch + column in (n, batch) arrays.
+    def __init__(self, arrival):
+        batch, n = arrival.shape
+        self.n, self.batch = n, batch
+        self.columns = np.arange(batch)
+        if (arrival[:, 1:] >= arrival[:, :-1]).all():
+            order = np.repeat(np.arange(n)[:, None], batch, axis=1)
+        else:
+            order = np.ascontiguousarray(np.argsort(arrival, axis=1, kind="stable").T)
+        # Flat position of every workload's arrivals, by rank * batch + column
+        self.position = order.ravel() * batch + np.tile(self.columns, n)
+        self.sorted = np.append(np.take_along_axis(arrival, order.T, axis=1).T.ravel(), np.full(batch, IDLE))
+        self.k = self.columns.copy()  # rank * batch + column of every workload's next arrival
+        self.next = self.sorted[:batch].copy()  # IDLE once all have arrived
+
+    def admit(self, t):
+        # Yields (columns, positions, k) of the processes that have arrived by t, one per
+        # workload at a time, in arrival order, with k = rank * batch + column. Workloads with
+        # nothing more arrived drop out.
+        columns = np.flatnonzero(self.next <= t)
+        while len(columns):
+            k = self.k[columns]
+            yield columns, self.position[k], k
+            k += self.batch
+            self.k[columns] = k
+            following = self.sorted[k]
+            self.next[columns] = following
+            columns = columns[following <= t[columns]]
+
+    def skip_idle(self, t, best, done=None):
+        # Workloads with nothing ready wait for their next arrival, unless all their
+        # processes are done
+        if best.max() == IDLE:
+            idle = np.flatnonzero(best == IDLE)
+            if done is not None:
+                idle = idle[done[idle] < self.n]
+            t[idle] = np.maximum(t[idle], self.next[idle])
+            return idle
+        return None
+
+def _priority_non_preemptive(arrival, burst, priority, quantum):
+    # Every step completes one process in every workload: the ready one with the highest
+    # priority, ties to the lowest index. With the arrivals of every workload in that order,
+    # the first one that is due is the choice, found with a max over ready flags weighted
+    # n, n - 1, ..., 1 by rank; done processes no longer arrive.
+    batch, n = arrival.shape
+    bits = n.bit_length()
+    columns = np.arange(batch)
+    # Sort keys end with the index; the large arrays are updated in place, as every fresh
+    # one costs about as much as the arithmetic on it
+    by_rank = priority * -(1 << bits)
+    by_rank += np.arange(n)
+    by_rank.sort(axis=1)
+    by_rank &= (1 << bits) - 1
+    by_rank += columns[:, None] * n  # flat position of every workload's process of every rank
+    # Arrival times in (n, batch) rank order, as int32 when they fit as that halves what every
+    # step compares; done processes get the largest value
+    limit = np.iinfo(np.int32).max
+    dtype = np.int32 if -limit < arrival.min() and arrival.max() < limit - 1 else np.int64
+    done = np.iinfo(dtype).max
+    arrived = arrival.ravel()[by_rank].T.astype(dtype, order="C")
+    flat = arrived.reshape(-1)  # rank * batch + column
+    by_rank = by_rank.ravel()
+    burst = burst.ravel()
+    completion = np.empty(batch * n, dtype=np.int64)
+    weights = np.arange(n, 0, -1, dtype=np.min_scalar_type(n))[:, None]
+    ready = np.empty((n, batch), dtype=bool)
+    due = np.empty((n, batch), dtype=weights.dtype)
+    best = np.empty(batch, dtype=weights.dtype)  # n - rank of the choice, 0 if nothing is ready
+    last = columns * n + n
+    t = arrived.min(axis=0).astype(np.int64)
+    now = np.empty(batch, dtype=dtype)
+
+    def choose():
+        np.minimum(t, done - 1, out=now, casting="unsafe")
+        np.multiply(np.less_equal(arrived, now, out=ready), weights, out=due)
+        np.maximum.reduce(due, axis=0, out=best)
+
+    for _ in range(n):
+        choose()
+        if not best.all():
+            # Workloads with nothing ready wait for their next arrival
+            idle = np.flatnonzero(best == 0)
+            t[idle] = arrived[:, idle].min(axis=0)
+            choose()
+        flat[(n - best.astype(np.int64)) * batch + columns] = done
+        position = by_rank[last - best]
+        t += burst[position]
+        completion[position] = t
+    return completion.reshape(batch, n)
+
+def _preemptive(arrival, burst, priority, by_priority):
+    # Runs the ready process with the smallest (priority key or remaining time, arrival,
+    # index) until it finishes or the next arrival, where the choice is made again. The
+    # pool keys end with the arrival rank, which stands for the arrival and the index.
+    # Every step ends at a completion or an arrival, so a workload takes at most 2n steps.
+    batch, n = arrival.shape
+    bits = n.bit_length()
+    arrivals = _Arrivals(arrival)
+    remaining = burst.T.flatten()
+    first = (-priority.T).ravel() if by_priority else remaining
+    pool = np.full((n, batch), IDLE)
+    flat = pool.reshape(-1)
+    completion = np.zeros(n * batch, dtype=np.int64)
+    t = np.zeros(batch, dtype=np.int64)
+    done = np.zeros(batch, dtype=np.int64)
+    best = np.empty(batch, dtype=np.int64)
+    if not by_priority:
+        rank = np.empty(n * batch, dtype=np.int64)
+        rank[arrivals.position] = np.arange(n).repeat(batch)
+
+    def admit():
+        for _, position, k in arrivals.admit(t):
+            flat[position] = first[position] * (1 << bits) + k // batch
+
+    while done.min() < n:
+        admit()
+        np.minimum.reduce(pool, axis=0, out=best)
+        idle = arrivals.skip_idle(t, best, done)
+        if idle is not None:
+            admit()
+            best[idle] = pool[:, idle].min(axis=0)
+        # Finished workloads pick an arbitrary process with nothing left, so they run for 0
+        position = arrivals.position[(best & ((1 << bits) - 1)) * batch + arrivals.columns]
+        left = remaining[position]
+        run = np.minimum(left, arrivals.next - t)
+        t += run
+        left -= run
+        remaining[position] = left
+        finished = (left == 0) & (run > 0)
+        ended = position[finished]
+        completion[ended] = t[finished]
+        if by_priority:
+            flat[ended] = IDLE
+        else:
+            flat[position] = np.where(left > 0, left * (1 << bits) + rank[position], IDLE)
+        done += finished
+    return completion.reshape(n, batch).T.copy()
+
+def _round_robin(arrival, burst, priority, quantum):
+    # The pool key is ticket and index: a process is queued with the next ticket of its
+    # workload and the smallest key runs next. Processes admitted together share a ticket,
+    # so they queue in index order, and arrivals during a slice get theirs before the
+    # process that ran is queued again, as in round_robin_slices.
+    if not quantum or quantum <= 0:
+        raise ValueError("Round Robin needs a quantum greater than 0")
+    batch, n = arrival.shape
+    bits = n.bit_length()
+    arrivals = _Arrivals(arrival)
+    columns = arrivals.columns
+    remaining = burst.T.flatten()
+    index = np.arange(n).repeat(batch)
+    pool = np.full((n, batch), IDLE)
+    flat = pool.reshape(-1)
+    completion = np.zeros(n * batch, dtype=np.int64)
+    t = np.zeros(batch, dtype=np.int64)
+    done = np.zeros(batch, dtype=np.int64)
+    tickets = np.zeros(batch, dtype=np.int64)
+    best = np.empty(batch, dtype=np.int64)
+
+    def admit():
+        admitted = None
+        for cols, position, _ in arrivals.admit(t):
+            flat[position] = tickets[cols] * (1 << bits) + index[position]
+            if admitted is None:
+                admitted = cols  # every later round is a subset of the first
+        if admitted is not None:
+            tickets[admitted] += 1
+
+    while done.min() < n:
+        np.minimum.reduce(pool, axis=0, out=best)
+        idle = arrivals.skip_idle(t, best, done)
+        if idle is not None:
+            admit()
+            best[idle] = pool[:, idle].min(axis=0)
+        # Finished workloads pick an arbitrary process with nothing left, so they run for 0
+        position = (best & ((1 << bits) - 1)) * batch + columns
+        left = remaining[position]
+        run = np.minimum(quantum, left)
+        t += run
+        left -= run
+        remaining[position] = left
+        admit()
+        again = left > 0
+        flat[position] = np.where(again, tickets * (1 << bits) + index[position], IDLE)
+        tickets += again
+        finished = (left == 0) & (run > 0)
+        completion[position[finished]] = t[finished]
+        done += finished
+    return completion.reshape(n, batch).T.copy()
+
+BATCH_ALGORITHMS = {
+    "FCFS": _fcfs,
+    "Round Robin": _round_robin,
+    "Priority Non-Preemptive": _priority_non_preemptive,
+    "Priority Preemptive": lambda arrival, burst, priority, quantum: _preemptive(arrival, burst, priority, True),
+    "SJF Preemptive": lambda arrival, burst, priority, quantum: _preemptive(arrival, burst, priority, False),
+}
+
+def schedule_batch(algorithm, arrival, burst, priority=None, quantum=None):
+    # Completion times of every row, as algorithms.schedule would give for each workload
+    if algorithm not in BATCH_ALGORITHMS:
+        raise ValueError(f"{algorithm} can only be simulated one workload at a time")
+    arrival = np.atleast_2d(np.asarray(arrival, dtype=np.int64))
+    burst = np.atleast_2d(np.asarray(burst, dtype=np.int64))
+    priority = np.zeros_like(arrival) if priority is None else np.atleast_2d(np.asarray(priority, dtype=np.int64))
+    if not arrival.shape == burst.shape == priority.shape or arrival.ndim != 2:
+        raise ValueError("arrival, burst and priority must be (batch, n) arrays of the same shape")
+    if arrival.size == 0:
+        return np.zeros(arrival.shape, dtype=np.int64)
+    if (burst <= 0).any():
+        raise ValueError("burst times must be greater than 0")
+    return BATCH_ALGORITHMS[algorithm](arrival, burst, priority, quantum)
+
+def stack_workloads(workloads):
+    # (arrival, burst, priority) arrays of models.Workloads that all have the same length
+    if len({len(w) for w in workloads}) > 1:
+        raise ValueError("batched workloads must all have the same number of processes")
+    return tuple(np.array([np.frombuffer(getattr(w, column), dtype=np.int64) for w in workloads]).reshape(
+        len(workloads), -1) for column in ("arrival", "burst", "priority"))
+
+def batch_metrics(arrival, burst, completion):
+    # Per-row averages, like metrics.compute_metrics for every workload
+    turnaround = completion - arrival
+    waiting = turnaround - burst
+    return {
+        "avg_turnaround": turnaround.mean(axis=1),
+        "avg_waiting": waiting.mean(axis=1),
+        "max_waiting": waiting.max(axis=1),
+        "makespan": completion.max(axis=1),
+    }
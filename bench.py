@@ -0,0 +1,244 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from algorithms import ALGORITHMS, QUANTUM_ALGORITHMS, schedule
+from models import Workload
+from workload import generate_random_processes
+
+SIZES = [1000, 5000, 20000]
+QUICK_SIZES = [500, 2000]
+BURSTS = {"narrow": 0.2, "wide": 1.0}      # burst std as a fraction of the mean
+LOADS = {"sparse": 0.5, "dense": 2.0}      # offered load: total burst / arrival span
+QUANTA = [1, 4, 16]
+BURST_MEAN = 10
+STARTUP_TARGET = 0.5                       # seconds from importing views to the main window drawn
+HEAVY_MODULES = ["numpy", "matplotlib"]    # must not be loaded until the first chart or simulation
+BATCH_SIZE = 5000                          # workloads per schedule_batch call
+BATCH_N = 20                               # processes per batched workload
+# Lowest accepted speedup of schedule_batch over looping schedule(): 20x for the policies that
+# parameter studies run, a floor against regressions for the other stepped policies
+BATCH_TARGETS = {"FCFS": 20, "Priority Non-Preemptive": 20, "Round Robin": 6, "Priority Preemptive": 8,
+                 "SJF Preemptive": 7}
+SMP_CHECK_RUNS = 500                       # random workloads compared by --smp-check
+
+# Run in a fresh interpreter so nothing bench.py imported is already loaded
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import tkinter as tk
+from views import SchedulerApp
+imported = time.perf_counter() - start
+window = None
+try:
+    root = tk.Tk()
+except tk.TclError:
+    pass  # No display, so only the import is timed
+else:
+    SchedulerApp(root)
+    root.update()
+    window = time.perf_counter() - start
+    root.destroy()
+print(json.dumps({"import": imported, "window": window,
+                  "heavy": sorted(m for m in sys.argv[1:] if m in sys.modules)}))
+"""
+
+def make_workload(n, burst, load, seed):
+    # Arrivals span roughly 4 std devs, so std follows from the offered load
+    arrival_std = n * BURST_MEAN / (4 * LOADS[load])
+    return Workload(*generate_random_processes(n, 2 * arrival_std, arrival_std, BURST_MEAN,
+                                               BURST_MEAN * BURSTS[burst], 3, seed=seed))
+
+def cases(sizes):
+    for n, burst, load, algorithm in itertools.product(sizes, BURSTS, LOADS, ALGORITHMS):
+        for quantum in (QUANTA if algorithm in QUANTUM_ALGORITHMS else [None]):
+            yield {"algorithm": algorithm, "n": n, "burst": burst, "load": load, "quantum": quantum}
+
+def case_id(case):
+    quantum = f"/q={case['quantum']}" if case["quantum"] else ""
+    return f"{case['algorithm']}{quantum}/n={case['n']}/{case['burst']}/{case['load']}"
+
+def measure(case, repeat, seed):
+    workload = make_workload(case["n"], case["burst"], case["load"], seed)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _, execution_log = schedule(case["algorithm"], workload, case["quantum"])
+        times.append(time.perf_counter() - start)
+    schedule_length = len(execution_log)
+    del execution_log
+
+    # Memory is measured in a separate run since tracing slows everything down
+    tracemalloc.start()
+    schedule(case["algorithm"], workload, case["quantum"])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dict(case, id=case_id(case), wall_time=min(times), peak_memory=peak, schedule_length=schedule_length)
+
+def compare(results, baseline, threshold):
+    base = {r["id"]: r for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        old = base.get(r["id"])
+        if old is None:
+            continue
+        for metric in ("wall_time", "peak_memory"):
+            if old[metric] > 0 and r[metric] > old[metric] * (1 + threshold):
+                regressions.append((r["id"], metric, old[metric], r[metric]))
+    return regressions
+
+def measure_startup(repeat):
+    # Best of `repeat` cold starts of the GUI
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT] + HEAVY_MODULES, check=True,
+                                stdout=subprocess.PIPE, cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+        runs.append(json.loads(output))
+    key = "window" if runs[0]["window"] is not None else "import"
+    best = min(runs, key=lambda run: run[key])
+    return best, key
+
+def startup_check(repeat, target):
+    best, key = measure_startup(repeat)
+    print(f"import views {best['import'] * 1000:.1f} ms", end="")
+    print(f", main window {best['window'] * 1000:.1f} ms" if best["window"] is not None else " (no display, window not timed)")
+    failed = False
+    if best["heavy"]:
+        print(f"FAIL heavy modules loaded at startup: {', '.join(best['heavy'])}")
+        failed = True
+    if best[key] > target:
+        print(f"FAIL startup took {best[key] * 1000:.1f} ms, target is {target * 1000:.0f} ms")
+        failed = True
+    if not failed:
+        print(f"Startup within {target * 1000:.0f} ms without loading {', '.join(HEAVY_MODULES)}")
+    return 1 if failed else 0
+
+def measure_batched(algorithm, workloads, columns, repeat):
+    # Best of `repeat` runs of schedule over every workload and of one schedule_batch call
+    from batched import schedule_batch
+    loop, batch = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        expected = [schedule(algorithm, workload, QUANTA[1])[0] for workload in workloads]
+        loop.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        completion = schedule_batch(algorithm, *columns, quantum=QUANTA[1])
+        batch.append(time.perf_counter() - start)
+    if completion.tolist() != [list(c) for c in expected]:
+        raise AssertionError(f"schedule_batch does not match schedule for {algorithm}")
+    return min(loop), min(batch)
+
+def batched_check(algorithms, repeat, seed, target=None):
+    from batched import BATCH_ALGORITHMS, stack_workloads
+    workloads = [make_workload(BATCH_N, "wide", "dense", seed + i) for i in range(BATCH_SIZE)]
+    columns = stack_workloads(workloads)
+    failed = False
+    for algorithm in algorithms:
+        if algorithm not in BATCH_ALGORITHMS:
+            continue
+        loop, batch = measure_batched(algorithm, workloads, columns, repeat)
+        print(f"{algorithm:<25} {BATCH_SIZE} x n={BATCH_N}: loop {loop * 1000:8.1f} ms, batched {batch * 1000:7.1f} ms, "
+              f"{loop / batch:5.1f}x", flush=True)
+        limit = target or BATCH_TARGETS[algorithm]
+        if loop / batch < limit:
+            print(f"FAIL {algorithm} batched is only {loop / batch:.1f}x faster, target is {limit:g}x")
+            failed = True
+    return 1 if failed else 0
+
+def smp_check(seed, runs=SMP_CHECK_RUNS):
+    # With one CPU, smp.schedule_smp must give the single-CPU schedule, also for arrivals out
+    # of order as in traces and tables
+    import random
+    from smp import POLICIES, schedule_smp
+    rng = random.Random(seed)
+    mismatches = 0
+    for run in range(runs):
+        n = rng.randint(1, 30)
+        workload = Workload(range(1, n + 1), [rng.randint(0, 4 * n) for _ in range(n)],
+                            [rng.randint(1, 10) for _ in range(n)], [rng.randint(0, 3) for _ in range(n)])
+        quantum = rng.randint(1, 4)
+        for algorithm in POLICIES:
+            expected, _ = schedule(algorithm, workload, quantum)
+            completion, _, _ = schedule_smp(algorithm, workload, 1, quantum)
+            if list(expected) != list(completion):
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"FAIL {algorithm} q={quantum} arrival={list(workload.arrival)} "
+                          f"burst={list(workload.burst)}: {list(completion)} != {list(expected)}")
+    if mismatches:
+        print(f"FAIL {mismatches} of {runs * len(POLICIES)} one-CPU schedules differ from schedule()")
+        return 1
+    print(f"{runs * len(POLICIES)} one-CPU schedules match schedule()")
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling algorithms.")
+    parser.add_argument("-o", "--output", default="bench_results.json", help="results file (default: %(default)s)")
+    parser.add_argument("-b", "--baseline", help="results file to compare against")
+    parser.add_argument("-t", "--threshold", type=float, default=0.2,
+                        help="relative slowdown or memory growth reported as a regression (default: %(default)s)")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="timed runs per case, best is kept")
+    parser.add_argument("-s", "--seed", type=int, default=1)
+    parser.add_argument("-n", "--sizes", type=int, nargs="+", help=f"process counts (default: {SIZES})")
+    parser.add_argument("--quick", action="store_true", help=f"small sweep (n in {QUICK_SIZES})")
+    parser.add_argument("-a", "--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS))
+    parser.add_argument("--startup", action="store_true",
+                        help="time GUI startup instead and fail if it is slow or loads " + ", ".join(HEAVY_MODULES))
+    parser.add_argument("--startup-target", type=float, default=STARTUP_TARGET,
+                        help="startup time limit in seconds (default: %(default)s)")
+    parser.add_argument("--smp-check", action="store_true",
+                        help="check that smp.py on one CPU gives the same schedules as algorithms.py")
+    parser.add_argument("--batched", action="store_true",
+                        help=f"compare batched.schedule_batch on {BATCH_SIZE} workloads against looping schedule")
+    parser.add_argument("--batch-target", type=float,
+                        help="lowest accepted batched speedup for every algorithm (default: per algorithm, "
+                             + ", ".join(f"{name} {limit}x" for name, limit in BATCH_TARGETS.items()) + ")")
+    args = parser.parse_args(argv)
+
+    if args.startup:
+        return startup_check(args.repeat, args.startup_target)
+    if args.smp_check:
+        return smp_check(args.seed)
+    if args.batched:
+        return batched_check(args.algorithms, args.repeat, args.seed, args.batch_target)
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else SIZES)
+
+    results = []
+    for case in cases(sizes):
+        if case["algorithm"] not in args.algorithms:
+            continue
+        result = measure(case, args.repeat, args.seed)
+        results.append(result)
+        print(f"{result['id']:<55} {result['wall_time'] * 1000:10.1f} ms {result['peak_memory'] / 2**20:8.1f} MiB"
+              f" {result['schedule_length']:>9} slices", flush=True)
+
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for id_, metric, old, new in regressions:
+            print(f"REGRESSION {id_}: {metric} {old:.6g} -> {new:.6g} (+{(new / old - 1) * 100:.0f}%)")
+        if regressions:
+            return 1
+        print(f"No regressions above {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
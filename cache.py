@@ -0,0 +1,109 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+
+# Results depend on the scheduling code as well as the workload, so a hash of its sources
+# is part of every key: pickles written by an older version are never served. These are the
+# modules behind cached results (runs, instrumented runs, comparisons, sweeps) and what they use.
+SOURCES = ("algorithms.py", "policies.py", "smp.py", "sweep.py", "comparison.py", "models.py", "metrics.py",
+           "instrumentation.py")
+
+def _code_version():
+    digest = hashlib.blake2b(digest_size=6)
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in SOURCES:
+        try:
+            with open(os.path.join(here, name), "rb") as file:
+                digest.update(file.read())
+        except OSError:
+            digest.update(name.encode())
+    return digest.hexdigest()
+
+CODE_VERSION = _code_version()
+
+def cache_key(workload, algorithm, quantum=None):
+    return f"{workload.fingerprint()}-{algorithm}-{quantum}-{CODE_VERSION}".replace(" ", "_")
+
+def _size(result):
+    # Approximate size in log entries, so a few huge Round Robin logs cannot fill memory
+    size = 1
+    for part in result if isinstance(result, tuple) else (result,):
+        if hasattr(part, "__len__"):
+            size += len(part)
+    return size
+
+class ResultCache:
+    # LRU of scheduler results keyed by workload fingerprint, algorithm and quantum,
+    # bounded by entry count and total size. With a directory, results are also
+    # pickled to disk and survive across sessions.
+    def __init__(self, max_entries=32, max_size=5_000_000, directory=None):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.directory = directory
+        self.entries = OrderedDict()  # key -> (result, size)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key][0]
+        if self.directory and os.path.exists(self._path(key)):
+            try:
+                with open(self._path(key), "rb") as file:
+                    result = pickle.load(file)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                os.remove(self._path(key))
+            else:
+                self._remember(key, result)
+                self.hits += 1
+                return result
+        self.misses += 1
+        return None
+
+    def put(self, key, result):
+        self._remember(key, result)
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write then rename, so a crash never leaves a truncated entry behind
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+
+    def _remember(self, key, result):
+        if key in self.entries:
+            self.size -= self.entries.pop(key)[1]
+        size = _size(result)
+        if size > self.max_size:
+            return
+        self.entries[key] = (result, size)
+        self.size += size
+        while len(self.entries) > self.max_entries or self.size > self.max_size:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.size -= evicted
+
+    def get_or_compute(self, key, compute):
+        result = self.get(key)
+        if result is None:
+            result = compute()
+            self.put(key, result)
+        return result
+
+    def clear(self, disk=False):
+        self.entries.clear()
+        self.size = 0
+        if disk and self.directory and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,93 @@
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from algorithms import ALGORITHMS, schedule
+from metrics import QuantileSketch, compute_metrics, process_times
+from models import Workload
+from workload import generate_random_processes
+
+def compare_workload(workload, quantum, progress=None):
+    # Average waiting time of every algorithm on one workload
+    results = {}
+    for i, algorithm in enumerate(ALGORITHMS):
+        ct, _ = schedule(algorithm, workload, quantum)
+        results[algorithm] = compute_metrics(workload, ct)["avg_waiting"]
+        if progress is not None:
+            progress((i + 1) / len(ALGORITHMS))
+    return results
+
+def _replicate(seed, params, quantum):
+    # {algorithm: (mean waiting, mean turnaround, waiting times)}
+    workload = Workload(*generate_random_processes(*params, seed=seed))
+    results = {}
+    for algorithm in ALGORITHMS:
+        ct, _ = schedule(algorithm, workload, quantum)
+        turnaround, waiting = process_times(workload, ct)
+        results[algorithm] = (float(waiting.mean()), float(turnaround.mean()), waiting)
+    return results
+
+def _replicate_chunk(seeds, params, quantum):
+    # Per-replication means, and every waiting time folded into one sketch per algorithm
+    # so only a few hundred buckets travel back instead of all the values
+    means = []
+    sketches = {algorithm: QuantileSketch() for algorithm in ALGORITHMS}
+    for seed in seeds:
+        results = _replicate(seed, params, quantum)
+        means.append({algorithm: (wt, tat) for algorithm, (wt, tat, _) in results.items()})
+        for algorithm, (_, _, waiting) in results.items():
+            sketches[algorithm].add(waiting)
+    return means, sketches
+
+def _summarize(samples):
+    # samples[r][algorithm] -> value; lower is better
+    algorithms = list(samples[0])
+    wins = dict.fromkeys(algorithms, 0.0)
+    for sample in samples:
+        best = min(sample.values())
+        winners = [a for a in algorithms if sample[a] == best]
+        for a in winners:
+            wins[a] += 1 / len(winners)  # Ties share the win
+
+    summary = {}
+    r = len(samples)
+    for a in algorithms:
+        values = [sample[a] for sample in samples]
+        mean = sum(values) / r
+        std = math.sqrt(sum((v - mean) ** 2 for v in values) / (r - 1)) if r > 1 else 0.0
+        summary[a] = {"mean": mean, "ci95": 1.96 * std / math.sqrt(r), "win_rate": wins[a] / r}
+    return summary
+
+def monte_carlo_compare(params, replications=200, quantum=2, seed=0, workers=None, progress=None):
+    # params are the generate_random_processes arguments after n included:
+    # (n, arrival_mean, arrival_std, burst_mean, burst_std, priority_lambda)
+    workers = workers or os.cpu_count()
+    seeds = list(range(seed, seed + replications))
+    chunk = max(1, math.ceil(replications / (workers * 4)))
+
+    # spawn keeps the workers independent of the Tk process that may start them
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [executor.submit(_replicate_chunk, seeds[i:i + chunk], params, quantum)
+                   for i in range(0, replications, chunk)]
+        for done, _ in enumerate(as_completed(futures), 1):
+            if progress is not None:
+                progress(done / len(futures))
+
+    # Merged in seed order, so the result does not depend on which chunk finished first
+    replicas = []
+    sketches = {algorithm: QuantileSketch() for algorithm in ALGORITHMS}
+    for future in futures:
+        means, chunk_sketches = future.result()
+        replicas.extend(means)
+        for algorithm, sketch in chunk_sketches.items():
+            sketches[algorithm].merge(sketch)
+
+    waiting = [{a: wt for a, (wt, _) in replica.items()} for replica in replicas]
+    turnaround = [{a: tat for a, (_, tat) in replica.items()} for replica in replicas]
+    summary = _summarize(waiting)
+    for algorithm, sketch in sketches.items():
+        # Tail of the waiting times of all processes of all replications
+        summary[algorithm]["p95_process"] = sketch.quantile(0.95)
+        summary[algorithm]["p99_process"] = sketch.quantile(0.99)
+    return {"replications": replications, "quantum": quantum,
+            "waiting": summary, "turnaround": _summarize(turnaround)}
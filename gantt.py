@@ -0,0 +1,143 @@
+import itertools
+import numpy as np
+from models import ExecutionLog
+
+# Matplotlib's tab20 colors, spelled out so that importing this module (and the headless
+# gantt_export) does not load pyplot; matplotlib itself is imported where a chart is drawn
+TAB20 = ["#1f77b4", "#aec7e8", "#ff7f0e", "#ffbb78", "#2ca02c", "#98df8a", "#d62728", "#ff9896", "#9467bd", "#c5b0d5",
+         "#8c564b", "#c49c94", "#e377c2", "#f7b6d2", "#7f7f7f", "#c7c7c7", "#bcbd22", "#dbdb8d", "#17becf", "#9edae5"]
+PALETTE = np.array([[int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in TAB20]) / 255
+
+def process_color(pid):
+    # Stable color per pid, the same in every chart
+    return PALETTE[pid % len(PALETTE)]
+
+def merge_bars(pid, start, end, x0, per_pixel):
+    # Merges everything that falls into the same pixel column (of per_pixel time units,
+    # counted from x0) into one bar, colored by the first slice in it
+    columns = np.floor((np.maximum(start, x0) - x0) / per_pixel).astype(np.int64)
+    first = np.unique(columns, return_index=True)[1]
+    return pid[first], start[first], np.maximum.reduceat(end, first)
+
+class GanttChart:
+    # Draws an execution log as a single bar collection per lane. Only the slices inside the
+    # visible x range are drawn, slices narrower than a pixel are merged, and the chart
+    # is redrawn whenever the x range changes (pan/zoom).
+    LABEL_LIMIT = 60     # Label bars only when at most this many are visible
+    LABEL_MIN_PX = 36    # and only those at least this many pixels wide
+    LEGEND_LIMIT = 20
+    BAR_Y, BAR_HEIGHT = 10, 9
+
+    def __init__(self, ax, execution_log, title="", lane_labels=None):
+        # With lane_labels, execution_log is a sequence of logs drawn one above the
+        # other, one lane per label (e.g. one per CPU)
+        self.ax = ax
+        logs = execution_log if lane_labels is not None else [execution_log]
+        self.lanes = [self._columns(log) for log in logs]
+        self.collections = []
+        self.texts = []
+
+        last_end = max((int(end.max()) for _, _, end, _ in self.lanes if len(end)), default=0)
+        ax.set_title(f"Gantt Chart - {title}")
+        ax.set_ylim(5, 10 * len(self.lanes) + 15)
+        if lane_labels is not None:
+            ax.set_yticks([self._lane_y(k) + self.BAR_HEIGHT / 2 for k in range(len(self.lanes))])
+            ax.set_yticklabels(lane_labels)
+        else:
+            ax.set_yticks([])
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+        self._add_legend()
+        ax.set_xlim(0, last_end + 1)
+        self.render()
+        ax.callbacks.connect("xlim_changed", lambda ax: self.render())
+        ax.figure.canvas.mpl_connect("resize_event", lambda event: self.render())
+
+    @staticmethod
+    def _columns(execution_log):
+        if isinstance(execution_log, ExecutionLog):
+            pid, start, end = execution_log.as_numpy()
+        else:
+            # Any other iterable of (pid, start, end), e.g. streamed slices, without a list of tuples
+            pid, start, end = np.fromiter(itertools.chain.from_iterable(execution_log), dtype=np.int64).reshape(-1, 3).T
+        # Indexing copies, so an ExecutionLog can still grow after the chart is drawn
+        order = np.argsort(start, kind="stable")
+        pid, start, end = pid[order], start[order], end[order]
+        # Running max of the end times lets a binary search find the first visible slice
+        reach = np.maximum.accumulate(end) if len(end) else end
+        return pid, start, end, reach
+
+    def _lane_y(self, k):
+        # The first lane is on top
+        return self.BAR_Y + 10 * (len(self.lanes) - 1 - k)
+
+    def _add_legend(self):
+        from matplotlib.lines import Line2D
+
+        all_pids = np.concatenate([pid for pid, _, _, _ in self.lanes])
+        first_seen = np.unique(all_pids, return_index=True)[1]
+        pids = all_pids[np.sort(first_seen)]
+        handles = [Line2D([0], [0], marker='s', color='w', markerfacecolor=process_color(p), markersize=10,
+                              label=f"P{p}") for p in pids[:self.LEGEND_LIMIT]]
+        if len(pids) > self.LEGEND_LIMIT:
+            handles.append(Line2D([0], [0], color='w', label=f"+{len(pids) - self.LEGEND_LIMIT} more"))
+        if handles:
+            self.ax.legend(handles=handles, loc='upper left', bbox_to_anchor=(1, 1))
+
+    def visible_bars(self, lane=0):
+        # Returns (pid, start, end) arrays of the bars to draw in a lane for the current view
+        pid, start, end, reach = self.lanes[lane]
+        x0, x1 = self.ax.get_xlim()
+        lo = np.searchsorted(reach, x0, side="right")
+        hi = np.searchsorted(start, x1, side="left")
+        pid, start, end = pid[lo:hi], start[lo:hi], end[lo:hi]
+
+        width_px = max(self.ax.get_window_extent().width, 1.0)
+        per_pixel = (x1 - x0) / width_px
+        if len(pid) <= width_px or per_pixel <= 0:
+            return pid, start, end
+
+        return merge_bars(pid, start, end, x0, per_pixel)
+
+    def render(self):
+        from matplotlib.ticker import MaxNLocator
+
+        ax = self.ax
+        bars = [self.visible_bars(k) for k in range(len(self.lanes))]
+        labelled = sum(len(pid) for pid, _, _ in bars) <= self.LABEL_LIMIT
+
+        for collection in self.collections:
+            collection.remove()
+        for text in self.texts:
+            text.remove()
+        self.collections = []
+        self.texts = []
+
+        x0, x1 = ax.get_xlim()
+        per_pixel = (x1 - x0) / max(ax.get_window_extent().width, 1.0)
+        all_wide = True
+        for k, (pid, start, end) in enumerate(bars):
+            y = self._lane_y(k)
+            self.collections.append(ax.broken_barh(np.column_stack((start, end - start)), (y, self.BAR_HEIGHT),
+                                                   facecolors=process_color(pid) if len(pid) else [],
+                                                   edgecolors='black' if labelled else 'face',
+                                                   linewidth=0.5, antialiased=labelled))
+
+            # Label only bars wide enough to hold their text; fall back to axis ticks otherwise
+            wide = (end - start) >= self.LABEL_MIN_PX * per_pixel
+            if not labelled:
+                wide[:] = False
+            all_wide = all_wide and bool(len(pid)) and wide.all()
+            for p, s, e in zip(pid[wide].tolist(), start[wide].tolist(), end[wide].tolist()):
+                self.texts.append(ax.text((s + e) / 2, y + 4.5, f"P{p}", ha='center', va='center',
+                                          color='white', fontweight='bold', fontsize=10, clip_on=True))
+
+        if all_wide and len(bars) == 1:
+            pid, start, end = bars[0]
+            ax.set_xticks([])
+            for s in start.tolist() + [int(end[-1])]:
+                self.texts.append(ax.text(s, self.BAR_Y - 1.5, f"{s}", ha='center', va='top', fontsize=9,
+                                          clip_on=True))
+        else:
+            ax.xaxis.set_major_locator(MaxNLocator(10, integer=True))
+        ax.figure.canvas.draw_idle()
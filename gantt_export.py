@@ -0,0 +1,226 @@
+import argparse
+import math
+import os
+import sys
+import numpy as np
+from gantt import PALETTE, TAB20, merge_bars
+from models import ExecutionLog
+
+# Headless Gantt export for schedules too long for the GUI chart. The log is read through
+# zero-copy NumPy views (memory-mapped when it comes from a file saved with
+# ExecutionLog.save), each time window is found by binary search and its slices are
+# merged per pixel column CHUNK slices at a time, so memory follows the image size and
+# not the number of slices.
+
+TILE_WIDTH = 2000       # pixels per tile
+SVG_RESOLUTION = 20000  # pixel columns of the single zoomable SVG
+CHUNK = 1 << 16
+LANE_HEIGHT = 30
+BAR_HEIGHT = 24
+LABEL_LIMIT = 60        # Label bars in a tile only when at most this many are drawn
+LABEL_MIN_PX = 36
+
+def open_lanes(source):
+    # source is an ExecutionLog, a file saved with ExecutionLog.save, an iterable of
+    # (pid, start, end), or a list of these, one per lane (e.g. per CPU). Returns
+    # (pid, start, end) arrays per lane, checked to be in time order.
+    if isinstance(source, (list, tuple)) and source and isinstance(source[0], (ExecutionLog, str)):
+        sources = source
+    else:
+        sources = [source]
+    lanes = []
+    for k, log in enumerate(sources):
+        if isinstance(log, str):
+            log = ExecutionLog.load(log, use_mmap=True)
+        elif not isinstance(log, ExecutionLog):
+            log = ExecutionLog.from_slices(log)  # 24 bytes per slice, run-length encoded
+        columns = log.as_numpy()
+        _check_order(columns, k)
+        lanes.append(columns)
+    return lanes
+
+def _check_order(columns, lane):
+    # Slices of one lane must not overlap and come in time order, so both the starts and the
+    # ends are sorted and a time window is found by binary search
+    _, start, end = columns
+    for i in range(0, len(start), CHUNK):
+        s, e = start[i:i + CHUNK + 1], end[i:i + CHUNK + 1]
+        if (s[1:] < s[:-1]).any() or (e[1:] < e[:-1]).any() or (e < s).any():
+            raise ValueError(f"the log of lane {lane} is not in time order")
+
+def time_range(lanes):
+    starts = [int(start[0]) for _, start, _ in lanes if len(start)]
+    ends = [int(end[-1]) for _, _, end in lanes if len(end)]
+    return min(starts, default=0), max(ends, default=0)
+
+def merged_chunks(columns, lo, hi, x0, per_pixel):
+    # Slices lo..hi merged per pixel column, CHUNK slices at a time. The last bar of a
+    # chunk is held back and merged again with the next chunk, as its column may go on.
+    pid, start, end = columns
+    held = None
+    for i in range(lo, hi, CHUNK):
+        j = min(i + CHUNK, hi)
+        chunk = (pid[i:j], start[i:j], end[i:j])
+        if held is not None:
+            chunk = tuple(np.concatenate(pair) for pair in zip(held, chunk))
+        p, s, e = merge_bars(*chunk, x0, per_pixel)
+        if len(p) > 1:
+            yield p[:-1], s[:-1], e[:-1]
+        held = (p[-1:], s[-1:], e[-1:])
+    if held is not None:
+        yield held
+
+def window_bars(columns, t0, t1, per_pixel):
+    # (pid, start, end) of the slices overlapping [t0, t1), merged per pixel column and
+    # clipped to the window
+    pid, start, end = columns
+    lo = np.searchsorted(end, t0, side="right")
+    hi = np.searchsorted(start, t1, side="left")
+    parts = list(merged_chunks(columns, lo, hi, t0, per_pixel))
+    if not parts:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty
+    pid, start, end = (np.concatenate(column) for column in zip(*parts))
+    return pid, np.maximum(start, t0), np.minimum(end, t1)
+
+def tile_windows(t_start, t_end, tiles=None, tile_span=None):
+    t_end = max(t_end, t_start + 1)
+    if tile_span is None:
+        tile_span = max(1, math.ceil((t_end - t_start) / (tiles or 1)))
+    if tile_span <= 0:
+        raise ValueError("tile_span must be greater than 0")
+    return [(t, min(t + tile_span, t_end)) for t in range(t_start, t_end, tile_span)]
+
+def export_tiles(source, directory, tiles=10, tile_span=None, fmt="png", width=TILE_WIDTH, title="",
+                 lane_labels=None, prefix="gantt", dpi=100):
+    # One image per time window of tile_span time units (or `tiles` equal windows).
+    # Returns the file names.
+    from matplotlib.figure import Figure
+    from matplotlib.ticker import MaxNLocator
+
+    lanes = open_lanes(source)
+    if lane_labels is None and len(lanes) > 1:
+        lane_labels = [f"CPU {c}" for c in range(len(lanes))]
+    t_start, t_end = time_range(lanes)
+    windows = tile_windows(t_start, t_end, tiles, tile_span)
+    os.makedirs(directory, exist_ok=True)
+
+    files = []
+    height = 1.2 + 0.3 * len(lanes)
+    for number, (t0, t1) in enumerate(windows):
+        fig = Figure(figsize=(width / dpi, height), dpi=dpi)
+        ax = fig.add_axes([0.06 if lane_labels else 0.01, 0.35 / height + 0.05, 0.93, 1 - 0.75 / height])
+        per_pixel = (t1 - t0) / (width * 0.93)
+        bars = [window_bars(columns, t0, t1, per_pixel) for columns in lanes]
+        labelled = sum(len(pid) for pid, _, _ in bars) <= LABEL_LIMIT
+        for k, (pid, start, end) in enumerate(bars):
+            y = LANE_HEIGHT * (len(lanes) - 1 - k)
+            ax.broken_barh(np.column_stack((start, end - start)), (y, BAR_HEIGHT),
+                           facecolors=PALETTE[pid % len(PALETTE)] if len(pid) else [],
+                           edgecolors='black' if labelled else 'face', linewidth=0.5, antialiased=labelled)
+            if labelled:
+                wide = (end - start) >= LABEL_MIN_PX * per_pixel
+                for p, s, e in zip(pid[wide].tolist(), start[wide].tolist(), end[wide].tolist()):
+                    ax.text((s + e) / 2, y + BAR_HEIGHT / 2, f"P{p}", ha='center', va='center', color='white',
+                            fontweight='bold', fontsize=9, clip_on=True)
+        ax.set_xlim(t0, t1)
+        ax.set_ylim(-3, LANE_HEIGHT * len(lanes))
+        if lane_labels:
+            ax.set_yticks([LANE_HEIGHT * (len(lanes) - 1 - k) + BAR_HEIGHT / 2 for k in range(len(lanes))])
+            ax.set_yticklabels(lane_labels)
+        else:
+            ax.set_yticks([])
+        ax.xaxis.set_major_locator(MaxNLocator(20, integer=True))
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+        ax.set_title(f"Gantt Chart - {title} [{t0}, {t1}) ({number + 1}/{len(windows)})" if title else
+                     f"Gantt Chart [{t0}, {t1}) ({number + 1}/{len(windows)})", fontsize=10)
+        filename = os.path.join(directory, f"{prefix}-{number:04d}.{fmt}")
+        fig.savefig(filename, format=fmt)
+        files.append(filename)
+    return files
+
+def export_svg(source, filename, resolution=SVG_RESOLUTION, title="", lane_labels=None):
+    # The whole schedule as one SVG, written chunk by chunk. Slices are merged down to
+    # `resolution` columns, so the file stays small enough for a browser to zoom in on;
+    # every bar has a tooltip with its (first) process and time range. Returns the bar count.
+    lanes = open_lanes(source)
+    if lane_labels is None and len(lanes) > 1:
+        lane_labels = [f"CPU {c}" for c in range(len(lanes))]
+    t_start, t_end = time_range(lanes)
+    span = max(t_end - t_start, 1)
+    per_pixel = span / resolution
+    left = 80 if lane_labels else 10
+    top = 30
+    height = top + LANE_HEIGHT * len(lanes) + 30
+    count = 0
+    # Below one time unit per column no two slices share a bar
+    label = "P{} {}-{}" if per_pixel <= 1 else "P{} and later slices {}-{}"
+
+    with open(filename, "w") as file:
+        file.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{resolution + left + 10}" height="{height}" '
+                   f'viewBox="0 0 {resolution + left + 10} {height}" font-family="sans-serif" font-size="12">\n')
+        file.write(f'<text x="{left}" y="18" font-size="14" font-weight="bold">'
+                   f'Gantt Chart{" - " + _escape(title) if title else ""}</text>\n')
+        for k, columns in enumerate(lanes):
+            y = top + LANE_HEIGHT * k
+            if lane_labels:
+                file.write(f'<text x="4" y="{y + BAR_HEIGHT / 2 + 4}">{_escape(lane_labels[k])}</text>\n')
+            file.write(f'<g transform="translate({left},{y})">\n')
+            for pid, start, end in merged_chunks(columns, 0, len(columns[0]), t_start, per_pixel):
+                x = (start - t_start) / per_pixel
+                w = np.maximum((end - start) / per_pixel, 0.2)
+                file.writelines(
+                    f'<rect x="{x_:.2f}" width="{w_:.2f}" height="{BAR_HEIGHT}" fill="{TAB20[p % len(TAB20)]}">'
+                    f'<title>{label.format(p, s, e)}</title></rect>\n'
+                    for p, s, e, x_, w_ in zip(pid.tolist(), start.tolist(), end.tolist(), x.tolist(), w.tolist()))
+                count += len(pid)
+            file.write('</g>\n')
+
+        # Time axis with about 20 ticks at round numbers
+        axis_y = top + LANE_HEIGHT * len(lanes)
+        file.write(f'<line x1="{left}" y1="{axis_y}" x2="{left + resolution}" y2="{axis_y}" stroke="black"/>\n')
+        step = _tick_step(span / 20)
+        for t in range(-(-t_start // step) * step, t_end + 1, step):
+            x = left + (t - t_start) / per_pixel
+            file.write(f'<line x1="{x:.2f}" y1="{axis_y}" x2="{x:.2f}" y2="{axis_y + 5}" stroke="black"/>'
+                       f'<text x="{x:.2f}" y="{axis_y + 18}" text-anchor="middle">{t}</text>\n')
+        file.write('</svg>\n')
+    return count
+
+def _tick_step(rough):
+    # 1, 2 or 5 times a power of ten
+    power = 10 ** max(0, math.floor(math.log10(max(rough, 1))))
+    return next(step * power for step in (1, 2, 5, 10) if step * power >= rough)
+
+def _escape(text):
+    return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export execution logs saved with ExecutionLog.save as Gantt charts.")
+    parser.add_argument("logs", nargs="+", help="log files; several are drawn as lanes (e.g. one per CPU)")
+    parser.add_argument("-o", "--output", required=True, help="directory for tiles, or a .svg file with --single")
+    parser.add_argument("--single", action="store_true", help="one zoomable SVG instead of tiles")
+    parser.add_argument("-f", "--format", choices=["png", "svg"], default="png", help="tile format (default: png)")
+    parser.add_argument("-t", "--tiles", type=int, default=10, help="number of tiles (default: %(default)s)")
+    parser.add_argument("--tile-span", type=int, help="time units per tile, instead of --tiles")
+    parser.add_argument("-w", "--width", type=int, help=f"pixels per tile (default: {TILE_WIDTH}) or SVG columns "
+                                                        f"with --single (default: {SVG_RESOLUTION})")
+    parser.add_argument("--title", default="")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.single:
+            bars = export_svg(args.logs, args.output, args.width or SVG_RESOLUTION, args.title)
+            print(f"Wrote {bars} bars to {args.output}")
+        else:
+            files = export_tiles(args.logs, args.output, args.tiles, args.tile_span, args.format,
+                                 args.width or TILE_WIDTH, args.title)
+            print(f"Wrote {len(files)} tiles to {args.output}")
+    except (OSError, ValueError) as e:
+        print(f"gantt_export: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
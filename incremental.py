@@ -0,0 +1,109 @@
+from array import array
+from bisect import bisect_left
+import numpy as np
+from algorithms import RESUMABLE, SLICES, arrival_order
+from models import ExecutionLog
+
+def changed_indices(old, new):
+    # Indices whose pid, arrival, burst or priority differ, plus any appended or removed
+    common = min(len(old), len(new))
+    changed = np.zeros(common, dtype=bool)
+    for a, b in zip(old, new):
+        changed |= np.frombuffer(a, dtype=np.int64)[:common] != np.frombuffer(b, dtype=np.int64)[:common]
+    return np.flatnonzero(changed).tolist() + list(range(common, max(len(old), len(new))))
+
+class IncrementalSchedule:
+    # A schedule that is kept up to date as its workload is edited. The run records
+    # checkpoints of the scheduler state; update() resumes from the last one taken before
+    # the earliest arrival an edit touches and splices the new tail onto the execution
+    # log and completion times, so the cost follows the affected suffix of the schedule.
+    # Plugin policies have no checkpoints and are recomputed from the start.
+    def __init__(self, algorithm, workload, quantum=None):
+        self.algorithm = algorithm
+        self.quantum = quantum
+        self.workload = workload
+        self.order = arrival_order(workload.arrival)
+        self.completion_time = array("q", bytes(8 * len(workload)))
+        self.execution_log = ExecutionLog()
+        self.checkpoints = []  # (t, k, ready state, log length, end of the last log entry)
+        self.times = []        # t of each checkpoint, for bisecting
+        self.resimulated = 0   # slices computed by the last run or update
+        self._run(None)
+
+    def _run(self, resume):
+        log = self.execution_log
+        completion_time = self.completion_time
+        pid = self.workload.pid
+        if self.algorithm not in RESUMABLE:
+            slices = SLICES[self.algorithm](self.workload, self.quantum)
+            self.resimulated = 0
+            for idx, start, end, finished in slices:
+                log.add_entry(pid[idx], start, end)
+                if finished:
+                    completion_time[idx] = end
+                self.resimulated += 1
+            return
+
+        taken = []
+        slices = SLICES[self.algorithm](self.workload, self.quantum, order=self.order, checkpoints=taken,
+                                        resume=resume)
+        seen = 0
+        count = 0
+        for idx, start, end, finished in slices:
+            if len(taken) != seen:
+                # Taken just before this slice, so the log as it is now goes with it
+                t, k, state = taken[seen]
+                self.checkpoints.append((t, k, state, len(log), log.end[-1] if len(log) else 0))
+                self.times.append(t)
+                seen += 1
+            log.add_entry(pid[idx], start, end)
+            if finished:
+                completion_time[idx] = end
+            count += 1
+        self.resimulated = count
+
+    def update(self, workload, changed=None):
+        # changed, if known, lists the edited indices; otherwise the columns are compared
+        old = self.workload
+        if changed is None:
+            changed = changed_indices(old, workload)
+        if not changed:
+            self.workload = workload
+            self.resimulated = 0
+            return self
+
+        # Both the old and the new arrival of an edited process bound what is still valid
+        earliest = min([old.arrival[i] for i in changed if i < len(old)] +
+                       [workload.arrival[i] for i in changed if i < len(workload)])
+        self.workload = workload
+        n = len(workload)
+        if len(self.completion_time) > n:
+            del self.completion_time[n:]
+        else:
+            self.completion_time.extend(array("q", bytes(8 * (n - len(self.completion_time)))))
+
+        # The last checkpoint strictly before every changed arrival is still valid
+        c = bisect_left(self.times, earliest) - 1 if self.algorithm in RESUMABLE else -1
+        if c < 0:
+            self.order = arrival_order(workload.arrival)
+            self.execution_log = ExecutionLog()
+            self.checkpoints = []
+            self.times = []
+            self._run(None)
+            return self
+
+        t, k, state, log_length, last_end = self.checkpoints[c]
+        del self.checkpoints[c + 1:]
+        del self.times[c + 1:]
+        self.execution_log.truncate(log_length, last_end)
+
+        # order[:k] is unchanged; the rest is re-sorted, which is cheap as it is mostly in order
+        edited = set(changed)
+        arrival_time = workload.arrival
+        rest = [i for i in self.order[k:] if i not in edited]
+        rest.extend(i for i in edited if i < n)
+        rest.sort(key=lambda i: (arrival_time[i], i))
+        del self.order[k:]
+        self.order.extend(rest)
+        self._run((t, k, state))
+        return self
@@ -0,0 +1,79 @@
+import time
+from array import array
+from algorithms import schedule_compact
+
+class SchedulerStats:
+    # Counters the *_slices generators update when one is passed as stats=...;
+    # with stats=None the schedulers skip all of this.
+    def __init__(self, series=True, sample_every=1):
+        self.dispatches = 0
+        self.context_switches = 0
+        self.idle_gaps = 0
+        self.idle_time = 0
+        self.max_queue = 0
+        self.selection_time = 0.0
+        self.elapsed = 0.0
+        self.series = series
+        self.sample_every = max(1, sample_every)
+        self.series_time = array("q")
+        self.series_queue = array("q")
+        self._last = -1
+        self._started = 0.0
+
+    def begin(self):
+        # The generators end the timer before every yield and begin it again when resumed,
+        # so only their own work counts, and a consumer that stops early leaves it stopped
+        self._started = time.perf_counter()
+
+    def end(self):
+        self.elapsed += time.perf_counter() - self._started
+
+    def select(self, pick, *args):
+        start = time.perf_counter()
+        choice = pick(*args)
+        self.selection_time += time.perf_counter() - start
+        return choice
+
+    def dispatch(self, t, idx, queue_length):
+        if self._last != -1 and idx != self._last:
+            self.context_switches += 1
+        self._last = idx
+        if queue_length > self.max_queue:
+            self.max_queue = queue_length
+        if self.series and self.dispatches % self.sample_every == 0:
+            self.series_time.append(t)
+            self.series_queue.append(queue_length)
+        self.dispatches += 1
+
+    def idle(self, gap):
+        self.idle_gaps += 1
+        self.idle_time += gap
+
+    def summary(self):
+        return {
+            "dispatches": self.dispatches,
+            "context_switches": self.context_switches,
+            "idle_gaps_skipped": self.idle_gaps,
+            "idle_time_skipped": self.idle_time,
+            "max_ready_queue": self.max_queue,
+            "mean_ready_queue": sum(self.series_queue) / len(self.series_queue) if self.series_queue else 0.0,
+            "selection_seconds": self.selection_time,
+            "bookkeeping_seconds": max(self.elapsed - self.selection_time, 0.0),
+        }
+
+    def time_series(self):
+        # (time, ready-queue length) at each sampled dispatch
+        return list(zip(self.series_time, self.series_queue))
+
+    def __str__(self):
+        s = self.summary()
+        return (f"Dispatches = {s['dispatches']}   |   Context Switches = {s['context_switches']}   |   "
+                f"Idle Gaps Skipped = {s['idle_gaps_skipped']} ({s['idle_time_skipped']} time units)\n"
+                f"Max Ready Queue = {s['max_ready_queue']}   |   Mean Ready Queue = {s['mean_ready_queue']:.1f}   |   "
+                f"Selection {s['selection_seconds'] * 1000:.1f} ms / Bookkeeping {s['bookkeeping_seconds'] * 1000:.1f} ms")
+
+def schedule_instrumented(algorithm, workload, quantum=None, progress=None):
+    # schedule_compact plus the SchedulerStats of the run, for the GUI's background tasks
+    stats = SchedulerStats(sample_every=max(1, len(workload) // 10000))
+    completion_time, execution_log = schedule_compact(algorithm, workload, quantum, progress, stats=stats)
+    return completion_time, execution_log, stats
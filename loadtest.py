@@ -0,0 +1,186 @@
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from service import HOST, PORT
+
+# Load test for service.py: keeps `concurrency` keep-alive connections busy with /schedule
+# requests for seeded generated workloads and reports throughput and latency. A share of
+# the requests repeat an earlier workload, which the service coalesces while in flight.
+
+PARAMS = {"arrival_mean": 500, "arrival_std": 150, "burst_mean": 10, "burst_std": 3, "priority_lambda": 3}
+
+async def read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed by the service")
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding") == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            chunk = await reader.readexactly(size + 2)
+            if size == 0:
+                break
+            chunks.append(chunk[:-2])
+        return status, b"".join(chunks)
+    return status, await reader.readexactly(int(headers.get("content-length") or 0))
+
+async def request(reader, writer, host, method, path, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status, body = await read_response(reader)
+    return status, json.loads(body)
+
+def make_payloads(args):
+    # Request i asks for workload seed i, unless it repeats one of the last few seeds
+    payloads = []
+    for i in range(args.requests):
+        seed = i
+        if args.duplicates and i and (i * 7919 % 1000) / 1000 < args.duplicates:
+            seed = i - 1 - i % min(i, args.concurrency)
+        payloads.append({"algorithms": args.algorithms, "quantum": args.quantum, "cpus": args.cpus, "log": args.log,
+                         "generate": dict(PARAMS, n=args.processes, seed=seed)})
+    return payloads
+
+async def client(host, port, payloads, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while payloads:
+            payload = payloads.pop()
+            start = time.perf_counter()
+            try:
+                status, body = await request(reader, writer, host, "POST", "/schedule", payload)
+            except (ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+                errors.append(str(e))
+                reader, writer = await asyncio.open_connection(host, port)
+                continue
+            if status == 200:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors.append(body.get("error", f"HTTP {status}"))
+    finally:
+        writer.close()
+
+async def get(host, port, path):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        return (await request(reader, writer, host, "GET", path))[1]
+    finally:
+        writer.close()
+
+def percentile(ordered, p):
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] if ordered else float("nan")
+
+async def run(args):
+    before = await get(args.host, args.port, "/stats")
+    payloads = make_payloads(args)[::-1]  # Popped from the end, so they go out in order
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(args.host, args.port, payloads, latencies, errors) for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+    after = await get(args.host, args.port, "/stats")
+
+    ordered = sorted(latencies)
+    report = {
+        "requests": args.requests,
+        "ok": len(latencies),
+        "errors": len(errors),
+        "concurrency": args.concurrency,
+        "processes": args.processes,
+        "algorithms": args.algorithms,
+        "seconds": elapsed,
+        "throughput": len(latencies) / elapsed,
+        "simulations_per_second": len(latencies) * len(args.algorithms) / elapsed,
+        "latency_mean": sum(latencies) / len(latencies) if latencies else float("nan"),
+        "latency_p50": percentile(ordered, 50),
+        "latency_p95": percentile(ordered, 95),
+        "latency_p99": percentile(ordered, 99),
+        "latency_max": ordered[-1] if ordered else float("nan"),
+        "service": {k: after[k] - before.get(k, 0) for k in after if k != "inflight"},
+    }
+    return report, errors
+
+def free_port():
+    with socket.socket() as s:
+        s.bind((HOST, 0))
+        return s.getsockname()[1]
+
+def start_service(port, workers):
+    # Runs service.py next to this file and waits until it answers
+    here = os.path.dirname(os.path.abspath(__file__))
+    command = [sys.executable, os.path.join(here, "service.py"), "--port", str(port)]
+    if workers:
+        command += ["--workers", str(workers)]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            asyncio.run(get(HOST, port, "/health"))
+            return process
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError("service.py exited during startup")
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("service.py did not start within 30 s")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the local simulation service.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("-p", "--port", type=int, default=PORT)
+    parser.add_argument("--spawn", action="store_true", help="start service.py on a free port for the test")
+    parser.add_argument("-j", "--workers", type=int, help="service worker processes with --spawn")
+    parser.add_argument("-r", "--requests", type=int, default=500)
+    parser.add_argument("-c", "--concurrency", type=int, default=16, help="simultaneous connections")
+    parser.add_argument("-n", "--processes", type=int, default=200, help="processes per workload")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=["FCFS", "Round Robin"])
+    parser.add_argument("-q", "--quantum", type=int, default=2)
+    parser.add_argument("--cpus", type=int, default=1)
+    parser.add_argument("-d", "--duplicates", type=float, default=0.2,
+                        help="share of requests repeating a recent workload (default: %(default)s)")
+    parser.add_argument("--no-log", dest="log", action="store_false", help="do not ask for execution logs")
+    parser.add_argument("-o", "--output", help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    service = None
+    if args.spawn:
+        args.host, args.port = HOST, free_port()
+        service = start_service(args.port, args.workers)
+    try:
+        report, errors = asyncio.run(run(args))
+    finally:
+        if service is not None:
+            service.terminate()
+            service.wait()
+
+    for error in sorted(set(errors))[:10]:
+        print(f"ERROR {error}")
+    print(f"{report['ok']}/{report['requests']} requests in {report['seconds']:.2f} s with "
+          f"{report['concurrency']} connections: {report['throughput']:.1f} requests/s, "
+          f"{report['simulations_per_second']:.1f} simulations/s")
+    print(f"latency mean {report['latency_mean'] * 1000:.1f} ms, p50 {report['latency_p50'] * 1000:.1f} ms, "
+          f"p95 {report['latency_p95'] * 1000:.1f} ms, p99 {report['latency_p99'] * 1000:.1f} ms, "
+          f"max {report['latency_max'] * 1000:.1f} ms")
+    s = report["service"]
+    print(f"service: {s['jobs']} jobs run, {s['coalesced']} coalesced, {s['batched_jobs']} in {s['batches']} batches")
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+import itertools
+import math
+import numpy as np
+from models import ExecutionLog
+
+# Scheduling metrics computed with NumPy over whole columns, plus a mergeable quantile
+# sketch for runs too large (or too spread out) to keep every value.
+
+PERCENTILES = (50, 95, 99)
+
+def _column(values):
+    return np.frombuffer(values, dtype=np.int64) if not isinstance(values, np.ndarray) else values
+
+def first_starts(workload, execution_log):
+    # First start time of every process, in workload order. execution_log is an
+    # ExecutionLog, a list of per-CPU ExecutionLogs or any iterable of (pid, start, end),
+    # including the streamed slices of a generator.
+    if isinstance(execution_log, ExecutionLog):
+        pid, start, _ = execution_log.as_numpy()
+    elif isinstance(execution_log, list) and execution_log and isinstance(execution_log[0], ExecutionLog):
+        columns = [log.as_numpy() for log in execution_log]
+        pid = np.concatenate([c[0] for c in columns])
+        start = np.concatenate([c[1] for c in columns])
+    else:
+        pid, start, _ = np.fromiter(itertools.chain.from_iterable(execution_log), dtype=np.int64).reshape(-1, 3).T
+    first = np.full(len(workload), np.iinfo(np.int64).max)
+    w_pid = _column(workload.pid)
+    by_pid = np.argsort(w_pid, kind="stable")
+    np.minimum.at(first, by_pid[np.searchsorted(w_pid[by_pid], pid)], start)
+    return first
+
+def process_times(workload, completion_time):
+    # Per-process (turnaround, waiting) arrays, in workload order
+    completion_time = np.asarray(completion_time, dtype=np.int64)
+    turnaround = completion_time - _column(workload.arrival)
+    return turnaround, turnaround - _column(workload.burst)
+
+def jain_fairness(values):
+    # 1 when every value is equal, 1/n when one process gets everything
+    values = np.asarray(values, dtype=np.float64)
+    squares = np.dot(values, values)
+    return float(values.sum() ** 2 / (len(values) * squares)) if squares else 1.0
+
+def compute_metrics(workload, completion_time, execution_log=None, cpus=1):
+    # Averages, waiting-time percentiles, throughput and utilization over the span from the
+    # first arrival to the last completion, and Jain's fairness of burst / turnaround (the
+    # share of its time in the system each process spent running). Response time needs
+    # the execution log.
+    n = len(workload)
+    if n == 0:
+        return {"processes": 0}
+    arrival = _column(workload.arrival)
+    burst = _column(workload.burst)
+    turnaround, waiting = process_times(workload, completion_time)
+    makespan = int(np.max(completion_time))
+    span = makespan - int(arrival.min())
+    metrics = {
+        "processes": n,
+        "makespan": makespan,
+        "avg_turnaround": float(turnaround.mean()),
+        "avg_waiting": float(waiting.mean()),
+        "max_waiting": int(waiting.max()),
+        "throughput": n / span if span else None,  # None, not inf, so JSON output stays standard
+        "utilization": float(burst.sum()) / (cpus * span) if span else 1.0,
+        "fairness": jain_fairness(burst / np.maximum(turnaround, 1)),
+    }
+    for p, value in zip(PERCENTILES, np.percentile(waiting, PERCENTILES)):
+        metrics[f"p{p}_waiting"] = float(value)
+    if execution_log is not None:
+        metrics["avg_response"] = float((first_starts(workload, execution_log) - arrival).mean())
+    return metrics
+
+class QuantileSketch:
+    # DDSketch-style sketch of non-negative values: each value is counted in a bucket
+    # gamma**(k-1) < value <= gamma**k, so any quantile is answered within the relative
+    # accuracy and the bucket count grows with the log of the value range, not with the
+    # number of values. Sketches of separate shards merge into the sketch of all of them.
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.offset = 0  # bucket key of counts[0]
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if not len(values):
+            return self
+        if (values < 0).any():
+            raise ValueError("QuantileSketch only holds non-negative values")
+        positive = values[values > 0]
+        self.zeros += len(values) - len(positive)
+        self.count += len(values)
+        self.total += float(values.sum())
+        self.max = max(self.max, float(values.max()))
+        if len(positive):
+            keys = np.ceil(np.log(positive) / self._log_gamma).astype(np.int64)
+            low = int(keys.min())
+            self._add_counts(low, np.bincount(keys - low))
+        return self
+
+    def _add_counts(self, low, counts):
+        if not len(self.counts):
+            self.offset, self.counts = low, counts.astype(np.int64)
+            return
+        start = min(self.offset, low)
+        end = max(self.offset + len(self.counts), low + len(counts))
+        if start != self.offset or end != self.offset + len(self.counts):
+            grown = np.zeros(end - start, dtype=np.int64)
+            grown[self.offset - start:self.offset - start + len(self.counts)] = self.counts
+            self.offset, self.counts = start, grown
+        self.counts[low - start:low - start + len(counts)] += counts
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("only sketches with the same relative accuracy can be merged")
+        self.zeros += other.zeros
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        if len(other.counts):
+            self._add_counts(other.offset, other.counts)
+        return self
+
+    def quantile(self, q):
+        if not self.count:
+            return float("nan")
+        rank = q * (self.count - 1)
+        if rank < self.zeros:
+            return 0.0
+        k = int(np.searchsorted(np.cumsum(self.counts), rank - self.zeros, side="right"))
+        # The bucket midpoint in relative terms, capped by the exact maximum
+        return min(2 * self.gamma ** (self.offset + k) / (self.gamma + 1), self.max)
+
+    def mean(self):
+        return self.total / self.count if self.count else float("nan")
+
+    def summary(self):
+        summary = {"count": self.count, "mean": self.mean(), "max": self.max}
+        for p in PERCENTILES:
+            summary[f"p{p}"] = self.quantile(p / 100)
+        return summary
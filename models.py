@@ -1,23 +1,170 @@
-class Process:
-    def __init__(self, pid, arrival_time, burst_time, priority=None):
-        self.pid = pid
-        self.arrival_time = arrival_time
-        self.burst_time = burst_time
-        self.priority = priority
-        self.remaining_time = burst_time
-        self.completion_time = 0
-        self.waiting_time = 0
-        self.turnaround_time = 0
+import hashlib
+import mmap
+import struct
+from array import array
+
+def _column(values):
+    # Columns are int64; existing int64 buffers are kept as they are instead of copied
+    if isinstance(values, array) and values.typecode == "q":
+        return values
+    if isinstance(values, memoryview) and values.format == "q":
+        return values
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array("q", values)
+    column = array("q")
+    if view.itemsize == 8 and view.format in ("q", "l") and view.c_contiguous:
+        column.frombytes(view.cast("B"))  # e.g. an int64 NumPy array, copied in one block
+    else:
+        column.extend(view.tolist())
+    return column
+
+class Workload:
+    # One contiguous column per attribute: 32 bytes per process instead of a
+    # Python object per process or four lists of boxed ints
+    __slots__ = ("pid", "arrival", "burst", "priority")
+
+    def __init__(self, pid, arrival, burst, priority=None):
+        self.pid = _column(pid)
+        self.arrival = _column(arrival)
+        self.burst = _column(burst)
+        self.priority = _column(priority) if priority is not None else array("q", bytes(8 * len(self.pid)))
+        if not len(self.pid) == len(self.arrival) == len(self.burst) == len(self.priority):
+            raise ValueError("Workload columns must all have the same length")
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __iter__(self):
+        # Unpacks like generate_random_processes: processes, arrival, burst, priorities = workload
+        return iter((self.pid, self.arrival, self.burst, self.priority))
+
+    def __reduce__(self):
+        # Memory-mapped columns cannot be pickled, so they travel as plain arrays
+        columns = []
+        for column in self:
+            if not isinstance(column, array):
+                copy = array("q")
+                copy.frombytes(column.cast("B"))
+                column = copy
+            columns.append(column)
+        return Workload, tuple(columns)
+
+    def fingerprint(self):
+        # Content hash of all four columns, used to key cached results
+        digest = hashlib.blake2b(digest_size=16)
+        for column in self:
+            digest.update(memoryview(column).cast("B"))
+        return digest.hexdigest()
+
+    def row(self, i):
+        return self.pid[i], self.arrival[i], self.burst[i], self.priority[i]
 
     def __str__(self):
-        return f"Process {self.pid}: Arrival={self.arrival_time}, Burst={self.burst_time}, Priority={self.priority}"
+        return f"Workload of {len(self)} processes"
 
 class ExecutionLog:
+    # Run-length encoded log of (pid, start, end) slices in three int64 columns.
+    # A slice that continues the previous one for the same process is merged into it.
+    MAGIC = b"OSLOG001"
+    HEADER = struct.Struct("<8sQ")
+
     def __init__(self):
-        self.log = []
+        self.pid = array("q")
+        self.start = array("q")
+        self.end = array("q")
+
+    @classmethod
+    def from_slices(cls, entries):
+        log = cls()
+        for process_id, start_time, end_time in entries:
+            log.add_entry(process_id, start_time, end_time)
+        return log
 
     def add_entry(self, process_id, start_time, end_time):
-        self.log.append((process_id, start_time, end_time))
+        if self.pid and self.pid[-1] == process_id and self.end[-1] == start_time:
+            self.end[-1] = end_time
+        else:
+            self.pid.append(process_id)
+            self.start.append(start_time)
+            self.end.append(end_time)
+
+    def truncate(self, length, last_end):
+        # Back to an earlier state of the log: its first `length` entries, the last of
+        # which ended at last_end (later slices may have been merged into it since)
+        del self.pid[length:]
+        del self.start[length:]
+        del self.end[length:]
+        if length:
+            self.end[-1] = last_end
 
     def get_log(self):
-        return self.log 
\ No newline at end of file
+        return list(self)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __iter__(self):
+        return zip(self.pid, self.start, self.end)
+
+    def __getitem__(self, i):
+        return self.pid[i], self.start[i], self.end[i]
+
+    def nbytes(self):
+        return 3 * 8 * len(self)
+
+    def as_numpy(self):
+        # Zero-copy views; the log cannot grow while they are alive
+        import numpy as np
+        return (np.frombuffer(self.pid, dtype=np.int64), np.frombuffer(self.start, dtype=np.int64),
+                np.frombuffer(self.end, dtype=np.int64))
+
+    def context_switches(self):
+        if len(self) < 2:
+            return 0
+        import numpy as np
+        pid, _, _ = self.as_numpy()
+        return int(np.count_nonzero(pid[1:] != pid[:-1]))
+
+    def process_stats(self, workload=None):
+        # Per-process first start, completion and slice count, sorted by pid.
+        # With a workload, response time (first start - arrival) is included too.
+        import numpy as np
+        pid, start, end = self.as_numpy()
+        pids, first, inverse, slices = np.unique(pid, return_index=True, return_inverse=True, return_counts=True)
+        completion = np.zeros(len(pids), dtype=np.int64)
+        np.maximum.at(completion, inverse, end)
+        stats = {"pid": pids, "first_start": start[first], "completion": completion, "slices": slices,
+                 "preemptions": slices - 1}
+        if workload is not None:
+            w_pid = np.frombuffer(workload.pid, dtype=np.int64)
+            w_arrival = np.frombuffer(workload.arrival, dtype=np.int64)
+            by_pid = np.argsort(w_pid)
+            arrival = w_arrival[by_pid][np.searchsorted(w_pid[by_pid], pids)]
+            stats["response"] = stats["first_start"] - arrival
+        return stats
+
+    def save(self, filename):
+        with open(filename, "wb") as file:
+            file.write(self.HEADER.pack(self.MAGIC, len(self)))
+            for column in (self.pid, self.start, self.end):
+                column.tofile(file)
+
+    @classmethod
+    def load(cls, filename, use_mmap=False):
+        # With use_mmap the columns are read-only views over the file instead of copies
+        log = cls()
+        with open(filename, "rb") as file:
+            magic, count = cls.HEADER.unpack(file.read(cls.HEADER.size))
+            if magic != cls.MAGIC:
+                raise ValueError(f"{filename} is not an execution log file")
+            if use_mmap:
+                data = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+                offset = cls.HEADER.size
+                columns = [data[offset + i * 8 * count:offset + (i + 1) * 8 * count].cast("q") for i in range(3)]
+                log.pid, log.start, log.end = columns
+            else:
+                for column in (log.pid, log.start, log.end):
+                    column.fromfile(file, count)
+        return log
@@ -0,0 +1,179 @@
+import heapq
+from array import array
+from collections import deque
+
+# Plugin schedulers. A policy subclasses Scheduler and is registered under its display
+# name with @register; algorithms.py turns every registered policy into a scheduler
+# that runs on policy_slices, so it shows up in the GUI, comparisons and benchmarks.
+
+DEFAULT_QUANTUM = 2
+PLUGINS = {}
+
+def register(name):
+    def decorator(policy):
+        PLUGINS[name] = policy
+        return policy
+    return decorator
+
+class Scheduler:
+    # admit() adds a process that became ready, pick() removes and returns the next one
+    # to run, slice_length() bounds how long it runs and on_slice_end() is called after
+    # every slice (the default puts unfinished processes back with admit()).
+    # len() is the number of ready processes.
+    preemptive = False    # End slices at the next arrival so pick() can reconsider
+    uses_quantum = False
+
+    def __init__(self, workload, quantum=None):
+        self.workload = workload
+        self.quantum = quantum or DEFAULT_QUANTUM
+
+    def admit(self, idx, t):
+        raise NotImplementedError
+
+    def pick(self, t):
+        raise NotImplementedError
+
+    def slice_length(self, idx, remaining):
+        return remaining
+
+    def on_slice_end(self, idx, ran, remaining, t):
+        if remaining > 0:
+            self.admit(idx, t)
+
+    def __len__(self):
+        raise NotImplementedError
+
+def policy_slices(policy, arrival_time, burst_time, stats=None):
+    # The event loop shared by all plugins: yields (index, start, end, finished) like
+    # the generators in algorithms.py and skips idle gaps the same way
+    n = len(arrival_time)
+    order = sorted(range(n), key=lambda i: arrival_time[i])
+    remaining = array("q", burst_time)
+    t = 0
+    k = 0
+
+    if stats is not None:
+        stats.begin()
+    while k < n or len(policy):
+        if not len(policy):
+            if stats is not None and arrival_time[order[k]] > t:
+                stats.idle(arrival_time[order[k]] - t)
+            t = max(t, arrival_time[order[k]])  # Skip idle gap
+        while k < n and arrival_time[order[k]] <= t:
+            policy.admit(order[k], t)
+            k += 1
+
+        if stats is None:
+            idx = policy.pick(t)
+        else:
+            idx = stats.select(policy.pick, t)
+            stats.dispatch(t, idx, len(policy))
+        start = t
+        t += min(policy.slice_length(idx, remaining[idx]), remaining[idx])
+        if policy.preemptive and k < n and arrival_time[order[k]] < t:
+            t = arrival_time[order[k]]
+        remaining[idx] -= t - start
+        if stats is not None:
+            stats.end()
+        yield idx, start, t, remaining[idx] == 0
+        if stats is not None:
+            stats.begin()
+
+        # Arrivals during the slice are admitted before the process goes back, as in Round Robin
+        while k < n and arrival_time[order[k]] <= t:
+            policy.admit(order[k], t)
+            k += 1
+        policy.on_slice_end(idx, t - start, remaining[idx], t)
+    if stats is not None:
+        stats.end()
+
+@register("MLFQ")
+class MLFQ(Scheduler):
+    # Multilevel feedback queue. New processes start at the top level and a process that
+    # uses up its level's quantum (doubling per level) drops one level. Arrivals preempt,
+    # and a process waiting longer than `aging` below the top is promoted one level.
+    preemptive = True
+    uses_quantum = True
+
+    def __init__(self, workload, quantum=None, levels=3, aging=None):
+        super().__init__(workload, quantum)
+        n = len(workload)
+        self.quanta = [self.quantum * 2 ** level for level in range(levels)]
+        self.aging = aging if aging is not None else 10 * self.quanta[-1]
+        self.queues = [deque() for _ in range(levels)]  # (index, time it was queued)
+        self.level = array("q", bytes(8 * n))
+        self.used = array("q", bytes(8 * n))  # time used of the current level's quantum
+        self.ready = 0
+
+    def admit(self, idx, t):
+        self.level[idx] = 0
+        self.used[idx] = 0
+        self.queues[0].append((idx, t))
+        self.ready += 1
+
+    def pick(self, t):
+        # Queues are in queueing order, so only their fronts can be due for promotion
+        for level in range(1, len(self.queues)):
+            queue = self.queues[level]
+            while queue and t - queue[0][1] >= self.aging:
+                idx, _ = queue.popleft()
+                self.level[idx] = level - 1
+                self.used[idx] = 0
+                self.queues[level - 1].append((idx, t))
+        for queue in self.queues:
+            if queue:
+                self.ready -= 1
+                return queue.popleft()[0]
+
+    def slice_length(self, idx, remaining):
+        return self.quanta[self.level[idx]] - self.used[idx]
+
+    def on_slice_end(self, idx, ran, remaining, t):
+        if remaining == 0:
+            return
+        level = self.level[idx]
+        self.used[idx] += ran
+        if self.used[idx] >= self.quanta[level]:
+            level = min(level + 1, len(self.queues) - 1)
+            self.level[idx] = level
+            self.used[idx] = 0
+        self.queues[level].append((idx, t))
+        self.ready += 1
+
+    def __len__(self):
+        return self.ready
+
+@register("CFS")
+class FairScheduler(Scheduler):
+    # Completely-fair-style: runs the ready process with the least virtual runtime for one
+    # quantum. Virtual runtime grows by the time run divided by the weight 1.25**priority,
+    # so higher priorities get proportionally more CPU; new processes start at the
+    # smallest virtual runtime seen so far instead of 0.
+    uses_quantum = True
+
+    def __init__(self, workload, quantum=None):
+        super().__init__(workload, quantum)
+        self.weight = array("d", (1.25 ** max(-20, min(p, 20)) for p in workload.priority))
+        self.vruntime = array("d", bytes(8 * len(workload)))
+        self.min_vruntime = 0.0
+        self.heap = []  # (vruntime, index)
+
+    def admit(self, idx, t):
+        self.vruntime[idx] = self.min_vruntime
+        heapq.heappush(self.heap, (self.min_vruntime, idx))
+
+    def pick(self, t):
+        vruntime, idx = heapq.heappop(self.heap)
+        self.min_vruntime = max(self.min_vruntime, vruntime)
+        return idx
+
+    def slice_length(self, idx, remaining):
+        return self.quantum
+
+    def on_slice_end(self, idx, ran, remaining, t):
+        if remaining > 0:
+            self.vruntime[idx] += ran / self.weight[idx]
+            heapq.heappush(self.heap, (self.vruntime[idx], idx))
+
+    def __len__(self):
+        return len(self.heap)
@@ -0,0 +1,382 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from algorithms import ALGORITHMS, ALIASES, QUANTUM_ALGORITHMS, schedule_compact
+from cache import cache_key
+from metrics import compute_metrics
+from models import Workload
+from policies import DEFAULT_QUANTUM
+from smp import POLICIES, schedule_smp
+from workload import ARRIVAL_MODELS, BURST_MODELS, generate_random_processes
+
+# Local HTTP/JSON simulation service, so other tools can run schedules without the GUI.
+#
+#   GET  /health       {"status": "ok"}
+#   GET  /algorithms   display names, which take a quantum and which run on several CPUs
+#   GET  /stats        request, coalescing and batching counters
+#   POST /schedule     {"algorithms": [...] or "algorithm": "...", "quantum": 2, "cpus": 1, "log": true,
+#                       "workload": {"pid": [...], "arrival": [...], "burst": [...], "priority": [...]}
+#                       or "generate": {"n": ..., "arrival_mean": ..., ..., "seed": ...}}
+#                      -> {"results": [{"algorithm", "quantum", "cpus", "completion_time", "metrics",
+#                                       "smp", "seed", "execution_log"}, ...]}
+#
+# Every algorithm of a request is one job, run in a process pool. Identical jobs that are
+# in flight at the same time are run once; jobs of at most BATCH_PROCESSES processes are
+# collected for BATCH_WINDOW seconds and sent to a worker together. Execution logs travel
+# back run-length encoded and are turned into JSON one chunk at a time while they are
+# written, so a large log goes out with chunked transfer encoding.
+
+HOST = "127.0.0.1"
+PORT = 8765
+MAX_BODY = 256 << 20
+BATCH_PROCESSES = 2000
+BATCH_SIZE = 32
+BATCH_WINDOW = 0.002
+LOG_CHUNK = 1 << 16  # log entries per streamed chunk
+GENERATOR_FIELDS = ("n", "arrival_mean", "arrival_std", "burst_mean", "burst_std", "priority_lambda")
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+           500: "Internal Server Error"}
+
+class RequestError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+def _simulate(job):
+    # Returns the JSON head of one result and the log (or per-CPU logs) still to be sent
+    algorithm, workload, generate, quantum, cpus, with_log = job
+    if workload is None:
+        workload = Workload(*generate_random_processes(
+            *(generate[field] for field in GENERATOR_FIELDS), seed=generate["seed"],
+            arrival_model=generate["arrival_model"], burst_model=generate["burst_model"]))
+    result = {"algorithm": algorithm, "quantum": quantum, "cpus": cpus, "processes": len(workload)}
+    if cpus == 1:
+        completion_time, log = schedule_compact(algorithm, workload, quantum)
+    else:
+        completion_time, log, stats = schedule_smp(algorithm, workload, cpus, quantum)
+        result["smp"] = stats.summary()
+    result["completion_time"] = completion_time
+    result["metrics"] = compute_metrics(workload, completion_time, log, cpus)
+    if generate is not None:
+        result["seed"] = generate["seed"]
+    return json.dumps(result).encode(), log if with_log else None
+
+def _simulate_batch(jobs):
+    # One failing job must not fail the others batched with it
+    results = []
+    for job in jobs:
+        try:
+            results.append((_simulate(job), None))
+        except Exception as e:
+            results.append((None, f"{job[0]}: {e}"))
+    return results
+
+def _int(value, name, minimum=None):
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise RequestError(f"{name} must be an integer")
+    if minimum is not None and value < minimum:
+        raise RequestError(f"{name} must be at least {minimum}")
+    return value
+
+def _number(value, name):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise RequestError(f"{name} must be a number")
+    return value
+
+def _parse_workload(columns):
+    if not isinstance(columns, dict):
+        raise RequestError("workload must be an object of columns")
+    try:
+        arrival, burst = columns["arrival"], columns["burst"]
+        workload = Workload(columns.get("pid") or range(1, len(arrival) + 1), arrival, burst, columns.get("priority"))
+    except KeyError as e:
+        raise RequestError(f"workload needs a {e.args[0]} column")
+    except (TypeError, OverflowError):
+        raise RequestError("workload columns must be lists of integers")
+    except ValueError as e:
+        raise RequestError(str(e))
+    if len(workload) == 0:
+        raise RequestError("the workload is empty")
+    if min(workload.arrival) < 0 or min(workload.burst) < 1:
+        raise RequestError("arrival times must be non-negative and burst times positive")
+    return workload
+
+def _parse_generate(params):
+    if not isinstance(params, dict):
+        raise RequestError("generate must be an object")
+    missing = [field for field in GENERATOR_FIELDS if field not in params]
+    if missing:
+        raise RequestError(f"generate needs {', '.join(missing)}")
+    generate = {field: _number(params[field], field) for field in GENERATOR_FIELDS}
+    _int(generate["n"], "n", 1)
+    # Without a seed one is drawn here, so every algorithm of the request sees the same workload
+    seed = params.get("seed")
+    generate["seed"] = _int(seed, "seed", 0) if seed is not None else int.from_bytes(os.urandom(8), "little") >> 1
+    generate["arrival_model"] = params.get("arrival_model", "normal")
+    generate["burst_model"] = params.get("burst_model", "normal")
+    if generate["arrival_model"] not in ARRIVAL_MODELS or generate["burst_model"] not in BURST_MODELS:
+        raise RequestError(f"arrival_model must be one of {', '.join(ARRIVAL_MODELS)} and burst_model one of "
+                           f"{', '.join(BURST_MODELS)}")
+    return generate
+
+def parse_request(body):
+    # Returns [(coalescing key, size in processes, job)], one per algorithm
+    try:
+        request = json.loads(body)
+    except ValueError as e:
+        raise RequestError(f"invalid JSON: {e}")
+    if not isinstance(request, dict):
+        raise RequestError("the request must be a JSON object")
+
+    algorithms = request.get("algorithms", [request["algorithm"]] if "algorithm" in request else None)
+    if not algorithms or not isinstance(algorithms, list):
+        raise RequestError("algorithms must be a non-empty list")
+    algorithms = [ALIASES.get(name, name) if isinstance(name, str) else name for name in algorithms]
+    unknown = [str(name) for name in algorithms if not isinstance(name, str) or name not in ALGORITHMS]
+    if unknown:
+        raise RequestError(f"unknown algorithms: {', '.join(unknown)}")
+    cpus = _int(request.get("cpus", 1), "cpus", 1)
+    if cpus > 1:
+        single = [name for name in algorithms if name not in POLICIES]
+        if single:
+            raise RequestError(f"{', '.join(single)} can only be simulated on one CPU")
+    quantum = _int(request.get("quantum", DEFAULT_QUANTUM), "quantum", 1)
+    with_log = bool(request.get("log", True))
+
+    if ("workload" in request) == ("generate" in request):
+        raise RequestError("give either a workload or generate parameters")
+    if "workload" in request:
+        workload, generate = _parse_workload(request["workload"]), None
+        size = len(workload)
+    else:
+        workload, generate = None, _parse_generate(request["generate"])
+        size = generate["n"]
+
+    jobs = []
+    for algorithm in algorithms:
+        q = quantum if algorithm in QUANTUM_ALGORITHMS else None
+        name = f"{algorithm}/cpus={cpus}/log={with_log}"
+        if workload is not None:
+            key = cache_key(workload, name, q)
+        else:
+            key = f"{json.dumps(generate, sort_keys=True)}-{name}-{q}"
+        jobs.append((key, size, (algorithm, workload, generate, q, cpus, with_log)))
+    return jobs
+
+def _log_pieces(log):
+    # The entries of one ExecutionLog as JSON text, LOG_CHUNK entries at a time
+    pid, start, end = log.pid, log.start, log.end
+    for i in range(0, len(log), LOG_CHUNK):
+        text = ",".join(map("[{},{},{}]".format, pid[i:i + LOG_CHUNK], start[i:i + LOG_CHUNK], end[i:i + LOG_CHUNK]))
+        yield (text if i == 0 else "," + text).encode()
+
+def body_pieces(results):
+    yield b'{"results":['
+    for r, (head, log) in enumerate(results):
+        if r:
+            yield b","
+        if log is None:
+            yield head
+            continue
+        yield head[:-1] + b',"execution_log":['
+        if isinstance(log, list):
+            for c, lane in enumerate(log):
+                yield b"[" if c == 0 else b",["
+                yield from _log_pieces(lane)
+                yield b"]"
+        else:
+            yield from _log_pieces(log)
+        yield b"]}"
+    yield b"]}"
+
+class SimulationService:
+    def __init__(self, workers=None):
+        self.executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                                            mp_context=multiprocessing.get_context("spawn"))
+        self.inflight = {}  # coalescing key -> future of the job's result
+        self.pending = []   # (job, future) of small jobs waiting for their batch
+        self.flush_handle = None
+        self.stats = {"requests": 0, "errors": 0, "jobs": 0, "coalesced": 0, "batches": 0, "batched_jobs": 0}
+
+    def close(self):
+        self.executor.shutdown()
+
+    async def run_job(self, key, size, job):
+        future = self.inflight.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(future)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.inflight[key] = future
+        future.add_done_callback(lambda _: self.inflight.pop(key, None))
+        self.stats["jobs"] += 1
+        if size <= BATCH_PROCESSES:
+            self.pending.append((job, future))
+            if len(self.pending) >= BATCH_SIZE:
+                self.flush()
+            elif self.flush_handle is None:
+                self.flush_handle = loop.call_later(BATCH_WINDOW, self.flush)
+        else:
+            self.dispatch([(job, future)])
+        return await asyncio.shield(future)
+
+    def flush(self):
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        batch, self.pending = self.pending, []
+        if batch:
+            self.stats["batches"] += 1
+            self.stats["batched_jobs"] += len(batch)
+            self.dispatch(batch)
+
+    def dispatch(self, batch):
+        loop = asyncio.get_running_loop()
+        done = loop.run_in_executor(self.executor, _simulate_batch, [job for job, _ in batch])
+
+        def resolve(done):
+            try:
+                results = done.result()
+            except Exception as e:  # e.g. a worker process died
+                results = [(None, str(e))] * len(batch)
+            for (_, future), (result, error) in zip(batch, results):
+                if future.done():
+                    continue
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(RequestError(error, 500))
+
+        done.add_done_callback(resolve)
+
+    async def schedule(self, body):
+        jobs = parse_request(body)
+        return await asyncio.gather(*(self.run_job(*job) for job in jobs))
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self.respond(writer, 400, {"error": "malformed request line"}, False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY:
+                    await self.respond(writer, 413, {"error": f"request body over {MAX_BODY} bytes"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                await self.route(writer, method, path.split("?")[0], body, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass  # Dropped connection or unreadable headers
+        finally:
+            writer.close()
+
+    async def route(self, writer, method, path, body, keep_alive):
+        self.stats["requests"] += 1
+        if path == "/schedule":
+            if method != "POST":
+                await self.respond(writer, 405, {"error": "use POST"}, keep_alive)
+                return
+            try:
+                results = await self.schedule(body)
+            except RequestError as e:
+                self.stats["errors"] += 1
+                await self.respond(writer, e.status, {"error": str(e)}, keep_alive)
+                return
+            await self.stream(writer, body_pieces(results), sum(_entries(log) for _, log in results), keep_alive)
+            return
+        pages = {
+            "/health": lambda: {"status": "ok"},
+            "/algorithms": lambda: {"algorithms": list(ALGORITHMS), "aliases": ALIASES,
+                                    "quantum": sorted(QUANTUM_ALGORITHMS), "multi_cpu": list(POLICIES)},
+            "/stats": lambda: dict(self.stats, inflight=len(self.inflight)),
+        }
+        if path not in pages:
+            await self.respond(writer, 404, {"error": f"no such path: {path}"}, keep_alive)
+        elif method != "GET":
+            await self.respond(writer, 405, {"error": "use GET"}, keep_alive)
+        else:
+            await self.respond(writer, 200, pages[path](), keep_alive)
+
+    def _headers(self, status, keep_alive, extra):
+        return (f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\n{extra}"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode()
+
+    async def respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode()
+        writer.write(self._headers(status, keep_alive, f"Content-Length: {len(body)}\r\n") + body)
+        await writer.drain()
+
+    async def stream(self, writer, pieces, entries, keep_alive):
+        # Small responses go out in one piece; large logs one chunk at a time, waiting for
+        # the client to keep up so the encoded log never piles up in the transport
+        if entries <= LOG_CHUNK:
+            body = b"".join(pieces)
+            writer.write(self._headers(200, keep_alive, f"Content-Length: {len(body)}\r\n") + body)
+            await writer.drain()
+            return
+        writer.write(self._headers(200, keep_alive, "Transfer-Encoding: chunked\r\n"))
+        for piece in pieces:
+            writer.write(b"%x\r\n%s\r\n" % (len(piece), piece))
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+def _entries(log):
+    if log is None:
+        return 0
+    return sum(len(lane) for lane in log) if isinstance(log, list) else len(log)
+
+async def serve(service, host, port, workers):
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f"Serving on http://{host}:{server.sockets[0].getsockname()[1]} with {workers} workers", flush=True)
+    # SIGTERM (e.g. from loadtest.py --spawn) stops the server like Ctrl+C, so main shuts
+    # the worker processes down instead of leaving them running
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except NotImplementedError:  # Windows: Ctrl+C raises KeyboardInterrupt instead
+            pass
+    async with server:
+        await stop.wait()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve scheduling simulations over HTTP/JSON on this machine.")
+    parser.add_argument("--host", default=HOST, help="address to listen on (default: %(default)s)")
+    parser.add_argument("-p", "--port", type=int, default=PORT, help="(default: %(default)s)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="simulation processes")
+    args = parser.parse_args(argv)
+
+    service = SimulationService(args.workers)
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.workers))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+import heapq
+import itertools
+from array import array
+from algorithms import arrival_order
+from models import ExecutionLog
+
+# Multi-CPU scheduling. Every CPU has its own run queue, a heap of (key, remaining,
+# index); new processes go to the least loaded CPU and a CPU that runs dry steals
+# from the most loaded one. The loop jumps from event to event (arrivals and the end
+# of running slices), so each event costs O(log n + log cpus).
+
+def _fifo_key(w):
+    tickets = itertools.count()
+    return lambda i, remaining: next(tickets)
+
+# display name -> (run queue key factory, preempt on arrival)
+POLICIES = {
+    "FCFS": (_fifo_key, False),
+    "Round Robin": (_fifo_key, False),  # time-sliced by the quantum
+    "Priority Non-Preemptive": (lambda w: lambda i, remaining: (-w.priority[i], i), False),
+    "Priority Preemptive": (lambda w: lambda i, remaining: (-w.priority[i], w.arrival[i], i), True),
+    "SJF Preemptive": (lambda w: lambda i, remaining: (remaining, w.arrival[i], i), True),
+}
+
+class SMPStats:
+    # Filled in by smp_slices; busy time per CPU gives utilization
+    def __init__(self, cpus):
+        self.cpus = cpus
+        self.slices = 0
+        self.preemptions = 0
+        self.migrations = 0
+        self.steals = 0
+        self.busy = array("q", bytes(8 * cpus))
+        self.makespan = 0
+
+    def summary(self):
+        utilization = [busy / self.makespan if self.makespan else 0.0 for busy in self.busy]
+        return {
+            "cpus": self.cpus,
+            "slices": self.slices,
+            "preemptions": self.preemptions,
+            "migrations": self.migrations,
+            "steals": self.steals,
+            "makespan": self.makespan,
+            "utilization": utilization,
+            "mean_utilization": sum(utilization) / self.cpus,
+        }
+
+    def __str__(self):
+        s = self.summary()
+        return (f"CPUs = {s['cpus']}   |   Makespan = {s['makespan']}   |   "
+                f"Mean Utilization = {s['mean_utilization']:.1%}\n"
+                f"Slices = {s['slices']}   |   Preemptions = {s['preemptions']}   |   "
+                f"Migrations = {s['migrations']}   |   Steals = {s['steals']}")
+
+def smp_slices(algorithm, workload, cpus, quantum=None, stats=None):
+    # Yields (cpu, index, start, end, finished). With cpus=1 the schedule is the same
+    # as the single-CPU algorithm of the same name.
+    if cpus < 1:
+        raise ValueError("cpus must be at least 1")
+    if algorithm == "Round Robin":
+        if not quantum or quantum <= 0:
+            raise ValueError("Round Robin needs a quantum greater than 0")
+    else:
+        quantum = None
+    if algorithm not in POLICIES:
+        raise ValueError(f"{algorithm} can only be simulated on one CPU")
+    make_key, preemptive = POLICIES[algorithm]
+    key = make_key(workload)
+    arrival_time, burst_time = workload.arrival, workload.burst
+    n = len(arrival_time)
+    order = arrival_order(arrival_time)
+
+    queues = [[] for _ in range(cpus)]
+    running = [-1] * cpus
+    run_start = [0] * cpus
+    run_remaining = [0] * cpus  # remaining time when the current slice started
+    version = [0] * cpus        # bumped on preemption to invalidate the slice's end event
+    flagged = [False] * cpus
+    last_cpu = array("q", [-1]) * n
+    pending = [[] for _ in range(cpus)]  # Round Robin arrivals not queued yet
+    waiting = []  # CPUs whose pending arrivals are queued at time t
+    events = []  # (slice end, cpu, version)
+
+    # Load is queue length plus the running process. Both heaps hold stale entries that
+    # are skipped on lookup and are rebuilt when they grow too large.
+    load = [0] * cpus
+    least = [(0, c) for c in range(cpus)]
+    most = [(0, c) for c in range(cpus)]
+    limit = 8 * cpus + 64
+
+    def set_load(c, value):
+        nonlocal least, most
+        load[c] = value
+        heapq.heappush(least, (value, c))
+        heapq.heappush(most, (-value, c))
+        if len(least) > limit:
+            least = [(load[c], c) for c in range(cpus)]
+            most = [(-load[c], c) for c in range(cpus)]
+            heapq.heapify(least)
+            heapq.heapify(most)
+
+    def least_loaded():
+        while load[least[0][1]] != least[0][0]:
+            heapq.heappop(least)
+        return least[0][1]
+
+    def most_loaded():
+        while load[most[0][1]] != -most[0][0]:
+            heapq.heappop(most)
+        return most[0][1]
+
+    k = 0
+    free = []     # CPUs to dispatch at time t
+    expired = []  # (cpu, index, remaining) of time slices that ran out at time t
+    while k < n or events:
+        t = events[0][0] if events else arrival_time[order[k]]
+        if k < n and arrival_time[order[k]] < t:
+            t = arrival_time[order[k]]  # Skips idle gaps too
+
+        # Slices ending now
+        while events and events[0][0] == t:
+            _, c, v = heapq.heappop(events)
+            if v != version[c]:
+                continue
+            idx = running[c]
+            remaining = run_remaining[c] - (t - run_start[c])
+            running[c] = -1
+            if pending[c]:
+                waiting.append(c)
+            yield c, idx, run_start[c], t, remaining == 0
+            if remaining == 0:
+                set_load(c, load[c] - 1)
+            else:
+                expired.append((c, idx, remaining))
+            flagged[c] = True
+            free.append(c)
+
+        # Arrivals go to the least loaded CPU and may preempt what runs there
+        while k < n and arrival_time[order[k]] <= t:
+            i = order[k]
+            k += 1
+            c = least_loaded()
+            set_load(c, load[c] + 1)
+            if quantum is not None:
+                # As in round_robin_slices, what arrives during a slice is queued when it
+                # ends, in index order
+                if not pending[c] and running[c] == -1:
+                    waiting.append(c)
+                pending[c].append(i)
+                continue
+            entry = (key(i, burst_time[i]), burst_time[i], i)
+            heapq.heappush(queues[c], entry)
+            if flagged[c]:
+                continue
+            if running[c] == -1:
+                flagged[c] = True
+                free.append(c)
+            elif preemptive:
+                idx = running[c]
+                remaining = run_remaining[c] - (t - run_start[c])
+                if entry[0] < key(idx, remaining):
+                    yield c, idx, run_start[c], t, False
+                    version[c] += 1
+                    running[c] = -1
+                    heapq.heappush(queues[c], (key(idx, remaining), remaining, idx))
+                    if stats is not None:
+                        stats.preemptions += 1
+                    flagged[c] = True
+                    free.append(c)
+
+        for c in waiting:
+            for i in sorted(pending[c]):
+                heapq.heappush(queues[c], (key(i, burst_time[i]), burst_time[i], i))
+            pending[c].clear()
+            if not flagged[c]:
+                flagged[c] = True
+                free.append(c)
+        waiting.clear()
+
+        # Expired time slices go to the back of their own CPU's queue
+        for c, idx, remaining in expired:
+            heapq.heappush(queues[c], (key(idx, remaining), remaining, idx))
+        expired.clear()
+
+        for c in free:
+            flagged[c] = False
+            queue = queues[c]
+            if queue:
+                _, remaining, idx = heapq.heappop(queue)
+            else:
+                # Steal only from a CPU with more than it is running
+                victim = most_loaded()
+                if load[victim] < 2 or not queues[victim]:
+                    continue
+                _, remaining, idx = heapq.heappop(queues[victim])
+                set_load(victim, load[victim] - 1)
+                set_load(c, load[c] + 1)
+                if stats is not None:
+                    stats.steals += 1
+            if stats is not None and last_cpu[idx] != -1 and last_cpu[idx] != c:
+                stats.migrations += 1
+            last_cpu[idx] = c
+            running[c] = idx
+            run_start[c] = t
+            run_remaining[c] = remaining
+            version[c] += 1
+            heapq.heappush(events, (t + (remaining if quantum is None else min(quantum, remaining)), c, version[c]))
+        free.clear()
+
+def schedule_smp(algorithm, workload, cpus, quantum=None, progress=None):
+    # Returns (completion times, one run-length encoded ExecutionLog per CPU, SMPStats)
+    n = len(workload)
+    completion_time = [0] * n
+    lanes = [ExecutionLog() for _ in range(cpus)]
+    stats = SMPStats(cpus)
+    pid = workload.pid
+    busy = stats.busy
+    step = max(1, n // 100)
+    completed = 0
+    for c, idx, start, end, finished in smp_slices(algorithm, workload, cpus, quantum, stats):
+        lanes[c].add_entry(pid[idx], start, end)
+        busy[c] += end - start
+        stats.slices += 1
+        if finished:
+            completion_time[idx] = end
+            completed += 1
+            if progress is not None and completed % step == 0:
+                progress(completed / n)
+    stats.makespan = max(completion_time, default=0)
+    return completion_time, lanes, stats
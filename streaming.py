@@ -0,0 +1,73 @@
+import csv
+from array import array
+from metrics import QuantileSketch
+
+# Consumers for the lazy slice streams of algorithms.iter_slices/stream_schedule.
+# Each one holds O(1) state per process at most, never the whole schedule.
+
+def fold_metrics(slices, workload):
+    # slices are (index, start, end, finished) tuples from algorithms.iter_slices
+    n = len(workload)
+    started = bytearray(n)
+    total_completion = 0
+    total_first_start = 0
+    slice_count = 0
+    context_switches = 0
+    makespan = 0
+    last_idx = -1
+    arrival_time, burst_time = workload.arrival, workload.burst
+    waiting = QuantileSketch()
+    pending = array("q")  # Waiting times not yet added to the sketch, which takes them in batches
+
+    for idx, start, end, finished in slices:
+        slice_count += 1
+        if idx != last_idx:
+            if last_idx != -1:
+                context_switches += 1
+            last_idx = idx
+        if not started[idx]:
+            started[idx] = 1
+            total_first_start += start
+        if finished:
+            total_completion += end
+            pending.append(end - arrival_time[idx] - burst_time[idx])
+            if len(pending) >= 4096:
+                waiting.add(pending)
+                del pending[:]
+        makespan = max(makespan, end)
+    waiting.add(pending)
+
+    if n == 0:
+        return {"processes": 0, "slices": 0}
+    total_arrival = sum(workload.arrival)
+    avg_turnaround = (total_completion - total_arrival) / n
+    return {
+        "processes": n,
+        "slices": slice_count,
+        "context_switches": context_switches,
+        "makespan": makespan,
+        "avg_turnaround": avg_turnaround,
+        "avg_waiting": avg_turnaround - sum(workload.burst) / n,
+        "avg_response": (total_first_start - total_arrival) / n,
+        "p50_waiting": waiting.quantile(0.50),
+        "p95_waiting": waiting.quantile(0.95),
+        "p99_waiting": waiting.quantile(0.99),
+    }
+
+def write_log(stream, filename):
+    # stream yields (pid, start, end) tuples, e.g. from algorithms.stream_schedule
+    count = 0
+    with open(filename, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(("pid", "start", "end"))
+        for entry in stream:
+            writer.writerow(entry)
+            count += 1
+    return count
+
+def read_log(filename):
+    with open(filename, "r", newline="") as file:
+        reader = csv.reader(file)
+        next(reader)  # Header
+        for pid, start, end in reader:
+            yield int(pid), int(start), int(end)
@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from algorithms import arrival_order, round_robin_slices
+
+def _evaluate(workload, order, quantum):
+    # Average waiting and turnaround time and context switches of one Round Robin run
+    total_completion = 0
+    switches = 0
+    last = -1
+    for idx, start, end, finished in round_robin_slices(workload.arrival, workload.burst, quantum, order=order):
+        if idx != last:
+            if last != -1:
+                switches += 1
+            last = idx
+        if finished:
+            total_completion += end
+    n = len(workload)
+    total_tat = total_completion - sum(workload.arrival)
+    return (total_tat - sum(workload.burst)) / n, total_tat / n, switches
+
+def _evaluate_chunk(workload, order, quanta):
+    return [(quantum, _evaluate(workload, order, quantum)) for quantum in quanta]
+
+def sweep_quanta(workload, quanta, workers=None, progress=None):
+    # Runs Round Robin for every quantum on one workload. The arrival order is computed
+    # once and shipped with the workload to each worker process.
+    quanta = sorted(set(quanta))
+    if not quanta or quanta[0] <= 0:
+        raise ValueError("quanta must be positive")
+    if len(workload) == 0:
+        raise ValueError("the workload is empty")
+    workers = min(workers or os.cpu_count(), len(quanta))
+    order = array("q", arrival_order(workload.arrival))
+
+    # Small quanta are the slow ones, so chunks take every k-th quantum to balance the load
+    chunks = min(len(quanta), workers * 4)
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [executor.submit(_evaluate_chunk, workload, order, quanta[i::chunks]) for i in range(chunks)]
+        for done, future in enumerate(as_completed(futures), 1):
+            results.update(future.result())
+            if progress is not None:
+                progress(done / chunks)
+
+    return {"n": len(workload), "quanta": quanta,
+            "waiting": [results[q][0] for q in quanta],
+            "turnaround": [results[q][1] for q in quanta],
+            "context_switches": [results[q][2] for q in quanta]}
+
+def best_quantum(sweep, switch_cost=0.0):
+    # Lowest average waiting time, charging switch_cost time units per context switch
+    # spread over all processes; ties go to the larger quantum (fewer switches).
+    scores = [wt + switch_cost * cs / sweep["n"] for wt, cs in zip(sweep["waiting"], sweep["context_switches"])]
+    best = min(range(len(scores)), key=lambda i: (scores[i], -sweep["quanta"][i]))
+    return sweep["quanta"][best]
+
+def parse_range(text):
+    # "1..200" or "1..200:5" (with a step) or a single number
+    text = text.strip()
+    step = 1
+    if ":" in text:
+        text, step = text.split(":")
+        step = int(step)
+    if ".." in text:
+        low, high = (int(v) for v in text.split(".."))
+    else:
+        low = high = int(text)
+    if low <= 0 or high < low or step <= 0:
+        raise ValueError(f"invalid quantum range {text!r}")
+    return list(range(low, high + 1, step))
+
+def main(argv=None):
+    from workload import load_processes
+
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) not in (2, 3):
+        print("usage: python sweep.py <workload file> <low..high[:step]> [switch cost]", file=sys.stderr)
+        return 2
+    workload = load_processes(argv[0])
+    sweep = sweep_quanta(workload, parse_range(argv[1]))
+    best = best_quantum(sweep, float(argv[2]) if len(argv) == 3 else 0.0)
+    print(f"{'quantum':>8} {'waiting':>12} {'turnaround':>12} {'switches':>10}")
+    for row in zip(sweep["quanta"], sweep["waiting"], sweep["turnaround"], sweep["context_switches"]):
+        print(f"{row[0]:>8} {row[1]:12.2f} {row[2]:12.2f} {row[3]:>10}" + ("  <- best" if row[0] == best else ""))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+import math
+import re
+import tkinter as tk
+from tkinter import ttk
+import numpy as np
+
+_FILTER = re.compile(r"^\s*(>=|<=|!=|>|<|=)?\s*(-?\d+(?:\.\d+)?)\s*(?:\.\.\s*(-?\d+(?:\.\d+)?))?\s*$")
+
+def parse_filter(text):
+    # ">10", "<=5", "!=3", "=7", "7", "3..8" (inclusive); a leading "P" is ignored so "P12" works.
+    # Returns a function from a column array to a boolean mask, or None for an empty filter.
+    text = text.strip().lstrip("Pp")
+    if not text:
+        return None
+    match = _FILTER.match(text)
+    if not match:
+        raise ValueError(f"Invalid filter: {text!r}")
+    op, low, high = match.groups()
+    low = float(low)
+    if high is not None:
+        if op:
+            raise ValueError(f"Invalid filter: {text!r}")
+        high = float(high)
+        return lambda values: (values >= low) & (values <= high)
+    return {
+        ">=": lambda values: values >= low,
+        "<=": lambda values: values <= low,
+        "!=": lambda values: values != low,
+        ">": lambda values: values > low,
+        "<": lambda values: values < low,
+    }.get(op, lambda values: values == low)
+
+class VirtualTable:
+    # A Treeview that only ever holds the rows on screen. Sorting and filtering work on
+    # an index array over the underlying NumPy columns, so opening, scrolling, sorting
+    # and filtering cost the same for 10 rows or 10^6.
+    def __init__(self, parent, columns, formats=None, height=20):
+        # columns: {heading: 1-D array}; formats: {heading: format string like "P{}"}
+        self.columns = {name: np.asarray(values) for name, values in columns.items()}
+        self.formats = formats or {}
+        self.names = list(self.columns)
+        self.length = len(next(iter(self.columns.values()))) if self.columns else 0
+        self.index = np.arange(self.length)
+        self.sort_column = None
+        self.descending = False
+        self.offset = 0
+
+        self.frame = tk.Frame(parent)
+
+        filter_frame = tk.Frame(self.frame)
+        filter_frame.pack(side=tk.TOP, fill=tk.X)
+        self.filters = {}
+        for name in self.names:
+            entry = tk.Entry(filter_frame, width=12, font=("Arial", 10))
+            entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=1)
+            entry.bind("<Return>", lambda event: self.apply_filters())
+            self.filters[name] = entry
+        tk.Button(filter_frame, text="Filter", command=self.apply_filters, relief="flat").pack(side=tk.LEFT, padx=2)
+
+        self.height = height
+        self.tree = ttk.Treeview(self.frame, columns=self.names, show="headings", height=height)
+        for name in self.names:
+            self.tree.heading(name, text=name, command=lambda name=name: self.sort_by(name))
+            self.tree.column(name, width=100, anchor="center")
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.status = tk.Label(parent, font=("Arial", 10))
+
+        for sequence, step in (("<Button-4>", -1), ("<Button-5>", 1)):
+            self.tree.bind(sequence, lambda event, step=step: self.scroll_to(self.offset + 3 * step))
+        # Windows reports multiples of 120 per notch, macOS small deltas: at least one step either way
+        self.tree.bind("<MouseWheel>", lambda event: self.scroll_to(
+            self.offset - 3 * int(math.copysign(max(1, abs(event.delta) // 120), event.delta))))
+        self.refresh()
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+        self.status.pack()
+
+    def on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self.scroll_to(int(float(args[0]) * len(self.index)))
+        elif action == "scroll":
+            amount = int(args[0]) * (self.height if args[1] == "pages" else 1)
+            self.scroll_to(self.offset + amount)
+
+    def scroll_to(self, offset):
+        self.offset = max(0, min(offset, len(self.index) - self.height))
+        self.refresh()
+
+    def sort_by(self, name):
+        self.descending = not self.descending if self.sort_column == name else False
+        self.sort_column = name
+        self._order()
+        self.scroll_to(0)
+
+    def apply_filters(self):
+        mask = np.ones(self.length, dtype=bool)
+        try:
+            for name, entry in self.filters.items():
+                predicate = parse_filter(entry.get())
+                if predicate is not None:
+                    mask &= predicate(self.columns[name])
+        except ValueError as e:
+            self.status.config(text=str(e), fg="red")
+            return
+        self.index = np.flatnonzero(mask)
+        self._order()
+        self.scroll_to(0)
+
+    def _order(self):
+        if self.sort_column is None:
+            return
+        keys = self.columns[self.sort_column][self.index]
+        order = np.argsort(-keys if self.descending else keys, kind="stable")
+        self.index = self.index[order]
+
+    def refresh(self):
+        self.tree.delete(*self.tree.get_children())
+        rows = self.index[self.offset:self.offset + self.height]
+        cells = [[self.formats.get(name, "{}").format(v) for v in self.columns[name][rows].tolist()]
+                 for name in self.names]
+        for values in zip(*cells):
+            self.tree.insert("", tk.END, values=values)
+
+        total = len(self.index)
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.height) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        shown = f"{self.offset + 1}-{self.offset + len(rows)}" if len(rows) else "0"
+        self.status.config(text=f"Rows {shown} of {total} (of {self.length})", fg="black")
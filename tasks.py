@@ -0,0 +1,83 @@
+import multiprocessing
+import queue
+import signal
+
+# spawn keeps the workers independent of the Tk process that starts them
+_CONTEXT = multiprocessing.get_context("spawn")
+
+def _stop(signum, frame):
+    # cancel() terminates the task with SIGTERM; processes the target started, such as
+    # the quantum sweep's pool, go with it instead of being left running
+    for child in multiprocessing.active_children():
+        child.terminate()
+    raise SystemExit(1)
+
+def _worker(target, args, messages):
+    signal.signal(signal.SIGTERM, _stop)
+    try:
+        result = target(*args, progress=lambda fraction: messages.put(("progress", fraction)))
+        messages.put(("done", result))
+    except Exception as e:
+        messages.put(("error", f"{type(e).__name__}: {e}"))
+
+class BackgroundTask:
+    # Runs target(*args, progress=callback) in its own process and reports back on the
+    # Tk thread by polling with root.after, so the window never blocks. Each task has
+    # its own process, so several tasks run at the same time, and cancel() kills it. A
+    # target that starts processes itself needs daemon=False, as daemons cannot have children.
+    def __init__(self, root, target, args=(), on_done=None, on_progress=None, on_error=None, poll_ms=50,
+                 daemon=True):
+        self.root = root
+        self.target = target
+        self.args = args
+        self.on_done = on_done
+        self.on_progress = on_progress
+        self.on_error = on_error
+        self.poll_ms = poll_ms
+        self.daemon = daemon
+        self.process = None
+        self.messages = None
+        self.finished = False
+
+    def start(self):
+        self.messages = _CONTEXT.Queue()
+        self.process = _CONTEXT.Process(target=_worker, args=(self.target, self.args, self.messages),
+                                         daemon=self.daemon)
+        self.process.start()
+        self.root.after(self.poll_ms, self._poll)
+        return self
+
+    def cancel(self):
+        if not self.finished:
+            self.finished = True
+            self.process.terminate()
+            self.process.join()
+
+    def _poll(self):
+        if self.finished:
+            return
+        progress = None
+        while True:
+            try:
+                kind, payload = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                progress = payload
+                continue
+            self.finished = True
+            self.process.join()
+            if kind == "done" and self.on_done:
+                self.on_done(payload)
+            elif kind == "error" and self.on_error:
+                self.on_error(payload)
+            return
+
+        if progress is not None and self.on_progress:
+            self.on_progress(progress)
+        if not self.process.is_alive() and self.messages.empty():
+            self.finished = True
+            if self.on_error:
+                self.on_error(f"Worker exited with code {self.process.exitcode}")
+            return
+        self.root.after(self.poll_ms, self._poll)
@@ -0,0 +1,94 @@
+import struct
+import sys
+import numpy as np
+from models import Workload
+
+# Workload trace layout: a 32-byte header followed by four int64 columns of n values
+# each (pid, arrival, burst, priority), so a trace maps straight into a Workload.
+MAGIC = b"OSTRACE1"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQ8x")  # magic, version, column count, n, padding
+COLUMNS = ("pid", "arrival", "burst", "priority")
+
+def save_trace(workload, filename):
+    with open(filename, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(COLUMNS), len(workload)))
+        for column in workload:
+            file.write(memoryview(column).cast("B"))
+
+def create_trace(filename, n):
+    # A new trace of n processes, returned as a writable (4, n) int64 numpy.memmap
+    with open(filename, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(COLUMNS), n))
+        file.truncate(HEADER.size + 8 * len(COLUMNS) * n)
+    if n == 0:
+        return np.empty((len(COLUMNS), 0), dtype=np.int64)  # An empty file region cannot be mapped
+    return np.memmap(filename, dtype=np.int64, mode="r+", offset=HEADER.size, shape=(len(COLUMNS), n))
+
+def read_header(filename):
+    with open(filename, "rb") as file:
+        data = file.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise ValueError(f"{filename} is not a workload trace")
+    magic, version, columns, n = HEADER.unpack(data)
+    if magic != MAGIC or columns != len(COLUMNS):
+        raise ValueError(f"{filename} is not a workload trace")
+    if version != VERSION:
+        raise ValueError(f"{filename}: unsupported trace version {version}")
+    return n
+
+def is_trace(filename):
+    try:
+        read_header(filename)
+    except (OSError, ValueError):
+        return False
+    return True
+
+def load_trace(filename):
+    # Zero-copy: the Workload columns are views over a read-only numpy.memmap of the file
+    n = read_header(filename)
+    if n == 0:
+        return Workload([], [], [], [])
+    data = np.memmap(filename, dtype=np.int64, mode="r", offset=HEADER.size, shape=(len(COLUMNS), n))
+    return Workload(*(memoryview(row).cast("B").cast("q") for row in data))
+
+def import_table(filename):
+    # Reads the tab-separated table written by "Save Processes to File" (count line,
+    # header, then "P<pid> arrival burst priority" rows) or a CSV with a header row
+    # naming pid/process, arrival, burst and priority columns.
+    with open(filename, "r") as file:
+        first = file.readline().strip()
+        second = file.readline().strip()
+
+    strip_p = {0: lambda s: int(s.strip().lstrip("Pp"))}
+    if "," in first:
+        names = [name.strip().lower() for name in first.split(",")]
+        names = ["pid" if name == "process" else name for name in names]
+        missing = [column for column in COLUMNS[:3] if column not in names]
+        if missing:
+            raise ValueError(f"{filename}: no {', '.join(missing)} column in header {first!r}")
+        positions = [names.index(column) for column in COLUMNS if column in names]
+        converters = {names.index("pid"): strip_p[0]}
+        data = np.loadtxt(filename, delimiter=",", skiprows=1, dtype=np.int64, converters=converters, ndmin=2)
+        columns = [data[:, p] for p in positions]
+    elif second.startswith("Process"):
+        data = np.loadtxt(filename, skiprows=2, dtype=np.int64, converters=strip_p, ndmin=2)
+        if len(data) != int(first):
+            raise ValueError(f"{filename}: expected {first} processes, found {len(data)}")
+        columns = [data[:, p] for p in range(len(COLUMNS))]
+    else:
+        raise ValueError(f"{filename} is not a process table")
+    return Workload(*(np.ascontiguousarray(column) for column in columns))
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print("usage: python tracefile.py <table.txt|table.csv> <output.trace>", file=sys.stderr)
+        return 2
+    workload = import_table(argv[0])
+    save_trace(workload, argv[1])
+    print(f"Wrote {len(workload)} processes to {argv[1]}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,19 @@
+import os
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from algorithms import round_robin, fcfs, priority_non_preemptive, sjf_preemptive
-from utils import get_random_color, draw_gantt_chart, print_table, generate_random_processes
+from algorithms import ALGORITHMS, QUANTUM_ALGORITHMS
+from cache import ResultCache, cache_key
+from smp import POLICIES, schedule_smp
+from sweep import best_quantum, parse_range, sweep_quanta
+from instrumentation import schedule_instrumented
+from models import Workload
+from tasks import BackgroundTask
+
+# Matplotlib, NumPy and the modules built on them (comparison, metrics, table, tracefile,
+# utils, workload) are imported in the methods that use them, so the main window opens
+# without loading them; `python bench.py --startup` checks this.
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "os_scheduler")
 
 class SchedulerApp:
     def __init__(self, root):
@@ -45,6 +55,7 @@ class SchedulerApp:
         self.burst_mean_entry = self.add_label_entry(self.input_frame, "Enter burst mean:")
         self.burst_std_entry = self.add_label_entry(self.input_frame, "Enter burst std dev:")
         self.priority_lambda_entry = self.add_label_entry(self.input_frame, "Enter priority lambda:")
+        self.seed_entry = self.add_label_entry(self.input_frame, "Enter seed (optional):")
 
         # Add buttons
         self.load_file_button = tk.Button(self.input_frame, text="Load Data from File", 
@@ -57,13 +68,16 @@ class SchedulerApp:
                 font=("Arial", 13, "bold"), bg=self.bg_color, fg=self.fg_color).pack()
 
         self.algorithm_var = tk.StringVar(value="FCFS")
-        for algo in ["FCFS", "Round Robin", "Priority Non-Preemptive", "SJF Preemptive"]:
+        for algo in ALGORITHMS:
             rb = tk.Radiobutton(self.algo_frame, text=algo, variable=self.algorithm_var, value=algo,
                               font=("Arial", 12), bg=self.bg_color, fg=self.fg_color, anchor="w",
                               selectcolor=self.radio_color)
             rb.pack(anchor="w")
 
-        self.quantum_entry = self.add_label_entry(self.algo_frame, "Enter quantum (if Round Robin)")
+        self.quantum_entry = self.add_label_entry(self.algo_frame, "Enter quantum (Round Robin, MLFQ, CFS)")
+        self.cpus_entry = self.add_label_entry(self.algo_frame, "Enter number of CPUs (default 1)")
+        self.replications_entry = self.add_label_entry(self.algo_frame, "Enter replications (Monte Carlo)")
+        self.sweep_entry = self.add_label_entry(self.algo_frame, "Enter quantum range (sweep, e.g. 1..200)")
 
         # Action buttons
         self.run_button = tk.Button(root, text="Run", command=self.run_algorithm,
@@ -84,11 +98,28 @@ class SchedulerApp:
                                      font=("Arial", 12, "bold"), bg=self.button_bg, fg=self.button_fg, relief="flat")
         self.compare_button.pack(pady=10)
 
+        self.monte_carlo_button = tk.Button(root, text="Monte Carlo Comparison",
+                                          command=self.monte_carlo_compare,
+                                          font=("Arial", 12, "bold"), bg=self.button_bg, fg=self.button_fg, relief="flat")
+        self.monte_carlo_button.pack(pady=10)
+
+        self.sweep_button = tk.Button(root, text="Quantum Sweep", command=self.sweep_quantum,
+                                    font=("Arial", 12, "bold"), bg=self.button_bg, fg=self.button_fg, relief="flat")
+        self.sweep_button.pack(pady=10)
+
+        # Running simulations, each with a progress bar and a Cancel button
+        self.tasks_frame = tk.Frame(root, bg=self.bg_color)
+        self.tasks_frame.pack(fill=tk.X, padx=20, pady=5)
+
         # Initialize process data
-        self.generated_processes = []
-        self.generated_arrival = []
-        self.generated_burst = []
-        self.generated_priorities = []
+        self.workload = None
+
+        # Results of earlier runs, keyed by workload fingerprint, algorithm and quantum
+        self.cache = ResultCache()
+        self.disk_cache_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(root, text="Keep results cache on disk", variable=self.disk_cache_var,
+                       command=self.toggle_disk_cache, font=("Arial", 11), bg=self.bg_color, fg=self.fg_color,
+                       selectcolor=self.radio_color).pack(pady=5)
 
     def toggle_theme(self):
         if self.theme == "light":
@@ -185,8 +216,22 @@ class SchedulerApp:
         return entry
 
     def load_data_from_file(self):
-        file_path = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt")])
-        if file_path:
+        from tracefile import is_trace
+        from workload import is_process_table, load_processes
+
+        file_path = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt"), ("Workload Traces", "*.trace"),
+                                                          ("CSV Files", "*.csv")])
+        if file_path and (is_trace(file_path) or is_process_table(file_path) or file_path.endswith(".csv")):
+            # A saved workload is replayed as is instead of regenerating processes
+            try:
+                self.workload = load_processes(file_path)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load workload: {e}")
+                return
+            self.n_entry.delete(0, tk.END)
+            self.n_entry.insert(0, str(len(self.workload)))
+            messagebox.showinfo("Success", f"Loaded {len(self.workload)} processes.")
+        elif file_path:
             with open(file_path, 'r') as file:
                 lines = file.readlines()
                 try:
@@ -218,25 +263,37 @@ class SchedulerApp:
                     messagebox.showerror("Error", "File format is incorrect. Please ensure it has the correct number of lines.")
 
     def save_processes_to_file(self):
-        if not self.generated_processes:
+        if self.workload is None:
             messagebox.showwarning("Warning", "No process data to save. Please run an algorithm first.")
             return
 
         file_path = filedialog.asksaveasfilename(defaultextension=".txt", 
-                                               filetypes=[("Text Files", "*.txt")])
+                                               filetypes=[("Text Files", "*.txt"), ("Workload Traces", "*.trace")])
         if file_path:
             try:
+                workload = self.workload
+                if file_path.endswith(".trace"):
+                    from tracefile import save_trace
+                    save_trace(workload, file_path)
+                    messagebox.showinfo("Success", "Process data saved successfully.")
+                    return
                 with open(file_path, 'w') as file:
-                    file.write(f"{len(self.generated_processes)}\n")
+                    file.write(f"{len(workload)}\n")
                     file.write("Process\tArrival\tBurst\tPriority\n")
-                    for i in range(len(self.generated_processes)):
-                        file.write(f"P{self.generated_processes[i]}\t{self.generated_arrival[i]}"
-                                 f"\t{self.generated_burst[i]}\t{self.generated_priorities[i]}\n")
+                    for pid, arrival, burst, priority in zip(*workload):
+                        file.write(f"P{pid}\t{arrival}\t{burst}\t{priority}\n")
                 messagebox.showinfo("Success", "Process data saved successfully.")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save file: {e}")
 
+    def get_seed(self):
+        # An empty seed field means fresh random processes every time
+        seed = self.seed_entry.get().strip()
+        return int(seed) if seed else None
+
     def reset_processes(self):
+        from workload import generate_random_processes
+
         try:
             n = int(self.n_entry.get())
             arrival_mean = float(self.arrival_mean_entry.get())
@@ -245,19 +302,17 @@ class SchedulerApp:
             burst_std = float(self.burst_std_entry.get())
             priority_lambda = float(self.priority_lambda_entry.get())
 
-            processes, arrival_time, burst_time, priorities = generate_random_processes(
-                n, arrival_mean, arrival_std, burst_mean, burst_std, priority_lambda)
-
-            self.generated_processes = processes
-            self.generated_arrival = arrival_time
-            self.generated_burst = burst_time
-            self.generated_priorities = priorities
+            self.workload = Workload(*generate_random_processes(
+                n, arrival_mean, arrival_std, burst_mean, burst_std, priority_lambda, seed=self.get_seed()))
+            self.cache.clear()  # Results for the old workload will not be asked for again
 
             messagebox.showinfo("Success", "Processes reset and regenerated.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to reset processes: {e}")
 
     def run_algorithm(self):
+        from workload import generate_random_processes
+
         try:
             n = int(self.n_entry.get())
             arrival_mean = float(self.arrival_mean_entry.get())
@@ -266,138 +321,173 @@ class SchedulerApp:
             burst_std = float(self.burst_std_entry.get())
             priority_lambda = float(self.priority_lambda_entry.get())
 
-            if not self.generated_processes:
-                processes, arrival_time, burst_time, priorities = generate_random_processes(
-                    n, arrival_mean, arrival_std, burst_mean, burst_std, priority_lambda)
-
-                self.generated_processes = processes
-                self.generated_arrival = arrival_time
-                self.generated_burst = burst_time
-                self.generated_priorities = priorities
-            else:
-                processes = self.generated_processes
-                arrival_time = self.generated_arrival
-                burst_time = self.generated_burst
-                priorities = self.generated_priorities
+            if self.workload is None:
+                self.workload = Workload(*generate_random_processes(
+                    n, arrival_mean, arrival_std, burst_mean, burst_std, priority_lambda, seed=self.get_seed()))
+            workload = self.workload
 
             algorithm = self.algorithm_var.get()
 
-            if algorithm == "Round Robin":
+            quantum = None
+            if algorithm in QUANTUM_ALGORITHMS:
                 quantum = int(self.quantum_entry.get())
                 if quantum <= 0:
-                    messagebox.showerror("Error", "Quantum must be greater than 0 for Round Robin.")
+                    messagebox.showerror("Error", f"Quantum must be greater than 0 for {algorithm}.")
                     return
-                completion_time, execution_log = round_robin(processes, arrival_time, burst_time, quantum)
-            elif algorithm == "FCFS":
-                completion_time, execution_log = fcfs(processes, arrival_time, burst_time)
-            elif algorithm == "Priority Non-Preemptive":
-                completion_time, execution_log = priority_non_preemptive(processes, arrival_time, burst_time, priorities)
-            elif algorithm == "SJF Preemptive":
-                completion_time, execution_log = sjf_preemptive(processes, arrival_time, burst_time)
-
-            result_window = tk.Toplevel(self.root)
-            result_window.title(f"Results - {algorithm}")
-            result_window.geometry("800x600")
 
-            gantt_frame = tk.Frame(result_window)
-            gantt_frame.pack(pady=10)
+            cpus = int(self.cpus_entry.get() or 1)
+            if cpus <= 0:
+                messagebox.showerror("Error", "Number of CPUs must be greater than 0.")
+                return
+            if cpus > 1 and algorithm not in POLICIES:
+                messagebox.showerror("Error", f"{algorithm} can only be simulated on one CPU.")
+                return
+            if cpus == 1:
+                title, lane_labels = algorithm, None
+                target, args = schedule_instrumented, (algorithm, workload, quantum)
+            else:
+                # One Gantt lane per CPU
+                title, lane_labels = f"{algorithm} ({cpus} CPUs)", [f"CPU {c}" for c in range(cpus)]
+                target, args = schedule_smp, (algorithm, workload, cpus, quantum)
 
-            table_frame = tk.Frame(result_window)
-            table_frame.pack(pady=10)
+            key = cache_key(workload, title, quantum)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.show_results(title, workload, *cached, lane_labels=lane_labels)
+                return
 
-            avg_frame = tk.Frame(result_window)
-            avg_frame.pack(pady=10)
+            def done(result):
+                self.cache.put(key, result)
+                self.show_results(title, workload, *result, lane_labels=lane_labels)
 
-            draw_gantt_chart(algorithm, execution_log, gantt_frame)
-            self.display_table_and_averages(processes, arrival_time, burst_time, completion_time, table_frame, avg_frame)
+            self.start_task(title, target, args, done)
 
         except Exception as e:
             messagebox.showerror("Error", f"Something went wrong: {e}")
 
-    def display_table_and_averages(self, processes, arrival_time, burst_time, completion_time, table_frame, avg_frame):
-        n = len(processes)
-        turnaround_time = [completion_time[i] - arrival_time[i] for i in range(n)]
-        waiting_time = [turnaround_time[i] - burst_time[i] for i in range(n)]
+    def start_task(self, title, target, args, on_done, daemon=True):
+        # Runs target in a background process with a progress bar and a Cancel button; the
+        # task is cancelled if the window closes first
+        row = tk.Frame(self.tasks_frame, bg=self.bg_color)
+        row.pack(fill=tk.X, pady=2)
+        tk.Label(row, text=title, width=25, anchor="w", font=("Arial", 11),
+                 bg=self.bg_color, fg=self.fg_color).pack(side=tk.LEFT)
+        bar = ttk.Progressbar(row, length=200, maximum=1.0)
+        bar.pack(side=tk.LEFT, padx=5)
+
+        def done(result):
+            row.destroy()
+            on_done(result)
+
+        def failed(message):
+            row.destroy()
+            messagebox.showerror("Error", f"{title} failed: {message}")
+
+        def cancel():
+            task.cancel()
+            row.destroy()
+
+        task = BackgroundTask(self.root, target, args, on_done=done, on_error=failed,
+                              on_progress=lambda fraction: bar.config(value=fraction), daemon=daemon)
+        row.bind("<Destroy>", lambda event: task.cancel())
+        tk.Button(row, text="Cancel", command=cancel, font=("Arial", 10), bg="orange", fg="white",
+                  relief="flat").pack(side=tk.LEFT)
+        task.start()
+        return task
+
+    def show_results(self, algorithm, workload, completion_time, execution_log, stats=None, lane_labels=None):
+        from utils import draw_gantt_chart
+
+        result_window = tk.Toplevel(self.root)
+        result_window.title(f"Results - {algorithm}")
+        result_window.geometry("800x600")
+
+        gantt_frame = tk.Frame(result_window)
+        gantt_frame.pack(pady=10)
+
+        table_frame = tk.Frame(result_window)
+        table_frame.pack(pady=10)
+
+        avg_frame = tk.Frame(result_window)
+        avg_frame.pack(pady=10)
+
+        draw_gantt_chart(algorithm, execution_log, gantt_frame, lane_labels)
+        self.display_table_and_averages(workload, completion_time, table_frame, avg_frame, execution_log,
+                                        len(lane_labels) if lane_labels else 1)
+        if stats is not None:
+            tk.Label(avg_frame, text=str(stats), font=("Arial", 11)).pack(pady=5)
+
+    def display_table_and_averages(self, workload, completion_time, table_frame, avg_frame, execution_log=None, cpus=1):
+        import numpy as np
+        from metrics import compute_metrics, process_times
+        from table import VirtualTable
+
+        n = len(workload)
+        arrival_time = np.frombuffer(workload.arrival, dtype=np.int64)
+        burst_time = np.frombuffer(workload.burst, dtype=np.int64)
+        completion_time = np.asarray(completion_time, dtype=np.int64)
+        turnaround_time, waiting_time = process_times(workload, completion_time)
 
         # Style for the Treeview
         style = ttk.Style()
         style.configure("Treeview", font=("Arial", 11))
         style.configure("Treeview.Heading", font=("Arial", 12, "bold"))
 
-        # Create the Treeview frame
-        tree_frame = tk.Frame(table_frame)
-        tree_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-
-        # Create the Treeview widget
-        tree = ttk.Treeview(tree_frame,
-                           columns=("Process", "Arrival", "Burst", "Completion", "Turnaround", "Waiting"),
-                           show="headings")
-
-        # Configure columns
-        for col in tree["columns"]:
-            tree.heading(col, text=col)
-            tree.column(col, width=100, anchor="center")
-
-        # Insert data rows
-        for i in range(n):
-            tree.insert("", "end", values=(f"P{processes[i]}", arrival_time[i], burst_time[i],
-                                         completion_time[i], turnaround_time[i], waiting_time[i]))
-
-        # Adjust height based on number of rows
-        rows_to_show = min(n, 20)
-        tree.config(height=rows_to_show)
-
-        tree.pack(fill=tk.BOTH, expand=True)
-
-        # Calculate and display averages
-        avg_tat = sum(turnaround_time) / n
-        avg_wt = sum(waiting_time) / n
-
+        # Only the rows on screen are materialized, so this stays fast for any n
+        table = VirtualTable(table_frame,
+                             {"Process": np.frombuffer(workload.pid, dtype=np.int64), "Arrival": arrival_time,
+                              "Burst": burst_time, "Completion": completion_time,
+                              "Turnaround": turnaround_time, "Waiting": waiting_time},
+                             formats={"Process": "P{}"}, height=min(n, 20))
+        table.pack(fill=tk.BOTH, expand=True, pady=10)
+
+        # Calculate and display averages, tail waiting times and whole-run metrics
+        m = compute_metrics(workload, completion_time, execution_log, cpus)
+        response = f"   |   Average Response Time = {m['avg_response']:.2f}" if "avg_response" in m else ""
         avg_label = tk.Label(avg_frame,
-                           text=f"Average Turnaround Time = {avg_tat:.2f}   |   Average Waiting Time = {avg_wt:.2f}",
+                           text=f"Average Turnaround Time = {m['avg_turnaround']:.2f}   |   "
+                                f"Average Waiting Time = {m['avg_waiting']:.2f}{response}",
                            font=("Arial", 14, "bold"))
         avg_label.pack(pady=10)
+        throughput = f"{m['throughput']:.3f}/unit" if m["throughput"] is not None else "n/a"
+        tk.Label(avg_frame,
+                 text=f"Waiting Time p50 / p95 / p99 = {m['p50_waiting']:.1f} / {m['p95_waiting']:.1f} / "
+                      f"{m['p99_waiting']:.1f}   |   Throughput = {throughput}   |   "
+                      f"CPU Utilization = {m['utilization']:.1%}   |   Fairness = {m['fairness']:.3f}",
+                 font=("Arial", 11)).pack(pady=5)
 
     def compare_algorithms(self):
-        if not self.generated_processes:
+        from comparison import compare_workload
+
+        if self.workload is None:
             messagebox.showwarning("Warning", "No process data to compare. Please run or reset processes first.")
             return
 
-        processes = self.generated_processes
-        arrival_time = self.generated_arrival
-        burst_time = self.generated_burst
-        priorities = self.generated_priorities
+        workload = self.workload
 
-        results = {}
-
-        # FCFS
-        ct, _ = fcfs(processes, arrival_time, burst_time)
-        tat = [ct[i] - arrival_time[i] for i in range(len(processes))]
-        wt = [tat[i] - burst_time[i] for i in range(len(processes))]
-        results["FCFS"] = sum(wt) / len(processes)
-
-        # Round Robin
         try:
             quantum = int(self.quantum_entry.get())
         except:
             quantum = 2  # Default quantum
 
-        ct, _ = round_robin(processes, arrival_time, burst_time, quantum)
-        tat = [ct[i] - arrival_time[i] for i in range(len(processes))]
-        wt = [tat[i] - burst_time[i] for i in range(len(processes))]
-        results["Round Robin"] = sum(wt) / len(processes)
+        key = cache_key(workload, "Compare Algorithms", quantum)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.display_comparison(cached)
+            return
+
+        def done(results):
+            self.cache.put(key, results)
+            self.display_comparison(results)
 
-        # Priority Non-Preemptive
-        ct, _ = priority_non_preemptive(processes, arrival_time, burst_time, priorities)
-        tat = [ct[i] - arrival_time[i] for i in range(len(processes))]
-        wt = [tat[i] - burst_time[i] for i in range(len(processes))]
-        results["Priority Non-Preemptive"] = sum(wt) / len(processes)
+        self.start_task("Compare Algorithms", compare_workload, (workload, quantum), done)
 
-        # SJF Preemptive
-        ct, _ = sjf_preemptive(processes, arrival_time, burst_time)
-        tat = [ct[i] - arrival_time[i] for i in range(len(processes))]
-        wt = [tat[i] - burst_time[i] for i in range(len(processes))]
-        results["SJF Preemptive"] = sum(wt) / len(processes)
+    def toggle_disk_cache(self):
+        self.cache.directory = CACHE_DIR if self.disk_cache_var.get() else None
+
+    def display_comparison(self, results):
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
         # Sort algorithms by lowest average waiting time
         sorted_results = sorted(results.items(), key=lambda x: x[1])
@@ -430,4 +520,123 @@ class SchedulerApp:
 
         # Display best algorithm
         tk.Label(chart_window, text=f"Best Algorithm: {best_algo} (Avg WT = {best_avg:.2f})",
-                font=("Arial", 16, "bold"), fg="green").pack(pady=10) 
\ No newline at end of file
+                font=("Arial", 16, "bold"), fg="green").pack(pady=10) 
+
+    def monte_carlo_compare(self):
+        from comparison import monte_carlo_compare
+
+        try:
+            params = (int(self.n_entry.get()), float(self.arrival_mean_entry.get()), float(self.arrival_std_entry.get()),
+                      float(self.burst_mean_entry.get()), float(self.burst_std_entry.get()),
+                      float(self.priority_lambda_entry.get()))
+            replications = int(self.replications_entry.get() or 200)
+            quantum = int(self.quantum_entry.get() or 2)
+            if replications <= 0 or quantum <= 0:
+                raise ValueError("replications and quantum must be greater than 0")
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid parameters: {e}")
+            return
+
+        # The replications run in their own process pool, so the task process is not a daemon
+        self.start_task("Monte Carlo Comparison", monte_carlo_compare, (params, replications, quantum),
+                        self.display_monte_carlo_results, daemon=False)
+
+    def display_monte_carlo_results(self, result):
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        waiting, turnaround = result["waiting"], result["turnaround"]
+        algos = list(waiting)
+        best_algo = max(algos, key=lambda a: (waiting[a]["win_rate"], -waiting[a]["mean"]))
+
+        window = tk.Toplevel(self.root)
+        window.title(f"Monte Carlo Comparison ({result['replications']} replications, quantum {result['quantum']})")
+        window.geometry("900x700")
+
+        fig, ax = plt.subplots(figsize=(7, 4))
+        colors = ['#3b82f6' if algo != best_algo else '#10b981' for algo in algos]
+        ax.bar(algos, [waiting[a]["mean"] for a in algos], yerr=[waiting[a]["ci95"] for a in algos],
+               color=colors, capsize=6)
+        ax.set_title("Mean Waiting Time with 95% Confidence Interval", fontsize=14)
+        ax.set_ylabel("Average Waiting Time", fontsize=12)
+        ax.set_xticks(range(len(algos)))
+        ax.set_xticklabels(algos, rotation=30, ha='right')
+        fig.tight_layout()
+
+        canvas = FigureCanvasTkAgg(fig, master=window)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        columns = ("Algorithm", "Mean WT", "WT 95% CI", "WT Win Rate", "Process WT p95", "Process WT p99", "Mean TAT",
+                   "TAT 95% CI", "TAT Win Rate")
+        tree = ttk.Treeview(window, columns=columns, show="headings", height=len(algos))
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=110, anchor="center")
+        for a in algos:
+            tree.insert("", "end", values=(a, f"{waiting[a]['mean']:.2f}", f"± {waiting[a]['ci95']:.2f}",
+                                           f"{waiting[a]['win_rate']:.0%}", f"{waiting[a]['p95_process']:.1f}",
+                                           f"{waiting[a]['p99_process']:.1f}", f"{turnaround[a]['mean']:.2f}",
+                                           f"± {turnaround[a]['ci95']:.2f}", f"{turnaround[a]['win_rate']:.0%}"))
+        tree.pack(fill=tk.X, padx=10, pady=10)
+
+        tk.Label(window, text=f"Best Algorithm: {best_algo} (wins {waiting[best_algo]['win_rate']:.0%} of replications)",
+                font=("Arial", 16, "bold"), fg="green").pack(pady=10)
+
+    def sweep_quantum(self):
+        if self.workload is None:
+            messagebox.showwarning("Warning", "No process data to sweep. Please run or reset processes first.")
+            return
+        try:
+            quanta = parse_range(self.sweep_entry.get() or "1..50")
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid quantum range: {e}")
+            return
+
+        workload = self.workload
+        key = cache_key(workload, "Quantum Sweep", f"{quanta[0]}..{quanta[-1]}:{len(quanta)}")
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.display_sweep(cached)
+            return
+
+        def done(result):
+            self.cache.put(key, result)
+            self.display_sweep(result)
+
+        # The sweep starts its own process pool, so its task process is not a daemon
+        self.start_task("Quantum Sweep", sweep_quanta, (workload, quanta), done, daemon=False)
+
+    def display_sweep(self, sweep):
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        best = best_quantum(sweep)
+        i = sweep["quanta"].index(best)
+
+        # The recommended quantum becomes the one Run and Compare Algorithms use
+        self.quantum_entry.delete(0, tk.END)
+        self.quantum_entry.insert(0, str(best))
+
+        window = tk.Toplevel(self.root)
+        window.title(f"Round Robin Quantum Sweep ({sweep['quanta'][0]}..{sweep['quanta'][-1]})")
+        window.geometry("800x800")
+
+        fig, axes = plt.subplots(3, 1, figsize=(7, 7), sharex=True)
+        for ax, (metric, label) in zip(axes, (("waiting", "Average Waiting Time"),
+                                              ("turnaround", "Average Turnaround Time"),
+                                              ("context_switches", "Context Switches"))):
+            ax.plot(sweep["quanta"], sweep[metric], color="#3b82f6")
+            ax.axvline(best, color="#10b981", linestyle="--")
+            ax.set_ylabel(label, fontsize=10)
+        axes[0].set_title("Round Robin Metrics per Quantum", fontsize=14)
+        axes[-1].set_xlabel("Quantum", fontsize=12)
+        fig.tight_layout()
+
+        canvas = FigureCanvasTkAgg(fig, master=window)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        tk.Label(window, text=f"Recommended Quantum: {best} (Avg WT = {sweep['waiting'][i]:.2f}, "
+                              f"{sweep['context_switches'][i]} context switches)",
+                 font=("Arial", 16, "bold"), fg="green").pack(pady=10)
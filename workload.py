@@ -0,0 +1,124 @@
+import argparse
+import sys
+import numpy as np
+from models import Workload
+from tracefile import COLUMNS, create_trace, import_table, is_trace, load_trace
+
+CHUNK_SIZE = 1 << 20
+ARRIVAL_MODELS = ("normal", "poisson")
+BURST_MODELS = ("normal", "lognormal", "pareto")
+
+def _draw_arrivals(rng, model, size, mean, std, clock):
+    # "normal": clipped Gaussian arrival times (sorted by the caller).
+    # "poisson": a Poisson process with exponential gaps of mean `mean`, continuing from
+    # clock, the unrounded time of the previous arrival. Returns (arrivals, clock).
+    if model == "normal":
+        return np.maximum(rng.normal(mean, std, size).astype(np.int64), 0), clock
+    if model == "poisson":
+        times = np.cumsum(np.concatenate(([clock], rng.exponential(mean, size))))[1:]
+        return times.astype(np.int64), times[-1]
+    raise ValueError(f"unknown arrival model {model!r}; choose from {', '.join(ARRIVAL_MODELS)}")
+
+def _draw_bursts(rng, model, size, mean, std):
+    # Every model has the given mean and std dev; lognormal and pareto are heavy-tailed
+    if model == "normal":
+        bursts = rng.normal(mean, std, size)
+    elif model == "lognormal":
+        sigma2 = np.log1p((std / mean) ** 2)
+        bursts = rng.lognormal(np.log(mean) - sigma2 / 2, np.sqrt(sigma2), size)
+    elif model == "pareto":
+        alpha = 1 + np.sqrt(1 + (mean / std) ** 2)  # Always > 2, so the variance is finite
+        bursts = (rng.pareto(alpha, size) + 1) * mean * (alpha - 1) / alpha
+    else:
+        raise ValueError(f"unknown burst model {model!r}; choose from {', '.join(BURST_MODELS)}")
+    return np.maximum(bursts.astype(np.int64), 1)
+
+def generate_chunks(n, arrival_mean, arrival_std, burst_mean, burst_std, priority_lambda, seed=None,
+                    arrival_model="normal", burst_model="normal", chunk_size=CHUNK_SIZE):
+    # Yields (pid, arrival, burst, priority) int64 arrays of at most chunk_size processes.
+    # Each column draws from its own stream spawned from seed, so the values do not depend
+    # on chunk_size. Normal-model arrivals are not sorted.
+    if arrival_model not in ARRIVAL_MODELS:
+        raise ValueError(f"unknown arrival model {arrival_model!r}; choose from {', '.join(ARRIVAL_MODELS)}")
+    if burst_model not in BURST_MODELS:
+        raise ValueError(f"unknown burst model {burst_model!r}; choose from {', '.join(BURST_MODELS)}")
+    arrival_rng, burst_rng, priority_rng = (np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(3))
+    clock = 0.0
+    for start in range(0, n, chunk_size):
+        size = min(chunk_size, n - start)
+        arrival, clock = _draw_arrivals(arrival_rng, arrival_model, size, arrival_mean, arrival_std, clock)
+        yield (np.arange(start + 1, start + size + 1, dtype=np.int64), arrival,
+               _draw_bursts(burst_rng, burst_model, size, burst_mean, burst_std),
+               priority_rng.poisson(priority_lambda, size).astype(np.int64))
+
+def _fill(columns, chunks):
+    # Copies generated chunks into preallocated (4, n) columns and sorts the arrivals
+    for pid, arrival, burst, priority in chunks:
+        start = int(pid[0]) - 1
+        for column, values in zip(columns, (pid, arrival, burst, priority)):
+            column[start:start + len(values)] = values
+    columns[1].sort()  # In place, also for a memory-mapped trace
+    return columns
+
+def generate_random_processes(n, arrival_mean, arrival_std, burst_mean, burst_std, priority_lambda, seed=None,
+                              arrival_model="normal", burst_model="normal"):
+    # Returns (processes, arrival_time, burst_time, priorities) as int64 NumPy arrays, with
+    # pids 1..n and arrivals in order. The same seed always gives the same processes.
+    columns = np.empty((len(COLUMNS), n), dtype=np.int64)
+    _fill(columns, generate_chunks(n, arrival_mean, arrival_std, burst_mean, burst_std, priority_lambda, seed,
+                                   arrival_model, burst_model))
+    return tuple(columns)
+
+def generate_trace(filename, n, arrival_mean, arrival_std, burst_mean, burst_std, priority_lambda, seed=None,
+                   arrival_model="normal", burst_model="normal", chunk_size=CHUNK_SIZE):
+    # Writes the same processes as generate_random_processes straight into a workload
+    # trace, one chunk at a time, so n is limited by disk rather than memory
+    columns = create_trace(filename, n)
+    _fill(columns, generate_chunks(n, arrival_mean, arrival_std, burst_mean, burst_std, priority_lambda, seed,
+                                   arrival_model, burst_model, chunk_size))
+    del columns  # Unmaps the file
+
+def read_parameters_from_file(filename):
+    with open(filename, 'r') as file:
+        lines = [line.strip() for line in file if line.strip()]
+        n = int(lines[0])
+        arrival_mean, arrival_std = map(float, lines[1].split())
+        burst_mean, burst_std = map(float, lines[2].split())
+        priority_lambda = float(lines[3])
+    return n, arrival_mean, arrival_std, burst_mean, burst_std, priority_lambda
+
+def is_process_table(filename):
+    # Tables written by "Save Processes to File" have a header on the second line
+    with open(filename, 'r') as file:
+        lines = [line.strip() for _, line in zip(range(2), file)]
+    return len(lines) == 2 and lines[1].startswith("Process")
+
+def load_processes(filename, seed=None):
+    # Returns a models.Workload from a workload trace, a saved process table (TSV or CSV)
+    # or a parameter file like Data/input.txt
+    if is_trace(filename):
+        return load_trace(filename)
+    if is_process_table(filename) or filename.endswith(".csv"):
+        return import_table(filename)
+    return Workload(*generate_random_processes(*read_parameters_from_file(filename), seed=seed))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a random workload trace.")
+    parser.add_argument("output", help="trace file to write")
+    parser.add_argument("n", type=int, help="number of processes")
+    parser.add_argument("--arrival", type=float, nargs=2, default=[8.5, 1.4], metavar=("MEAN", "STD"),
+                        help="arrival time mean and std dev, or mean gap with --arrivals poisson")
+    parser.add_argument("--burst", type=float, nargs=2, default=[10, 5.3], metavar=("MEAN", "STD"))
+    parser.add_argument("--priority-lambda", type=float, default=7.9)
+    parser.add_argument("--arrivals", choices=ARRIVAL_MODELS, default="normal", help="arrival model")
+    parser.add_argument("--bursts", choices=BURST_MODELS, default="normal", help="burst distribution")
+    parser.add_argument("-s", "--seed", type=int)
+    args = parser.parse_args(argv)
+
+    generate_trace(args.output, args.n, *args.arrival, *args.burst, args.priority_lambda, args.seed,
+                   args.arrivals, args.bursts)
+    print(f"Wrote {args.n} processes to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())